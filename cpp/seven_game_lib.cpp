@@ -10,44 +10,716 @@
 #include <vector>
 #include <algorithm>
 #include <random>
-#include <map>
 #include <ctime>
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <string>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
 
 using namespace std;
 
+// Детермінований генератор для роздачі за seed (splitmix64).
+// Той самий алгоритм реалізований у Python, тому роздачі збігаються.
+static uint64_t splitmix64(uint64_t& state) {
+    state += 0x9E3779B97F4A7C15ULL;
+    uint64_t z = state;
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+// Бітові маски карт: індекс карти = suit * 9 + (rank - 6)
+static inline uint64_t cardBit(int rank, int suit) {
+    return 1ULL << (suit * 9 + (rank - 6));
+}
+
+// Кільцевий буфер подій гри.
+// Копія гри (клон, доігрування) не успадковує і не записує події,
+// тож аналіз позицій не платить за них.
+class EventLog {
+public:
+    static const int CAPACITY = 256;
+
+    bool enabled;
+    uint64_t next_seq;
+    vector<Event> ring;
+
+    EventLog() : enabled(true), next_seq(1), ring(CAPACITY) {}
+    EventLog(const EventLog&) : enabled(false), next_seq(1) {}
+    EventLog& operator=(const EventLog&) { return *this; }
+
+    void push(int type, int player, Card card = {0, 0}) {
+        if (!enabled) return;
+        Event& event = ring[(next_seq - 1) % CAPACITY];
+        event.seq = next_seq++;
+        event.type = type;
+        event.player = player;
+        event.card = card;
+    }
+
+    int poll(uint64_t since_seq, Event* out, int max_events) const {
+        if (!enabled) return 0;
+
+        uint64_t oldest = next_seq > CAPACITY ? next_seq - CAPACITY : 1;
+        uint64_t seq = max(since_seq + 1, oldest);
+        int count = 0;
+        for (; seq < next_seq && count < max_events; seq++) {
+            out[count++] = ring[(seq - 1) % CAPACITY];
+        }
+        return count;
+    }
+};
+
+// Всі 36 карт колоди як бітова маска
+static const uint64_t FULL_DECK = (1ULL << 36) - 1;
+
+// Біти value на позиціях mask, стиснуті до молодших бітів (програмний pext)
+static inline uint64_t extractBits(uint64_t value, uint64_t mask) {
+    uint64_t result = 0;
+    for (uint64_t bit = 1; mask; bit <<= 1) {
+        if (value & mask & (~mask + 1)) result |= bit;
+        mask &= mask - 1;
+    }
+    return result;
+}
+
+// Результат позиції 2 гравців: переможець (біт OUTCOME_WINNER - гравець 1)
+// та кількість ходів до кінця гри
+static const uint16_t OUTCOME_WINNER = 0x4000;
+static const uint16_t OUTCOME_PLIES = 0x3FFF;
+
+static inline uint16_t addPly(uint16_t outcome) {
+    return (outcome & OUTCOME_WINNER) | ((outcome & OUTCOME_PLIES) + 1);
+}
+
+// Чи кращий результат a за b для гравця side
+static inline bool betterOutcome(uint16_t a, uint16_t b, int side) {
+    bool a_wins = ((a & OUTCOME_WINNER) != 0) == (side == 1);
+    bool b_wins = ((b & OUTCOME_WINNER) != 0) == (side == 1);
+    if (a_wins != b_wins) return a_wins;
+    if (a_wins) return (a & OUTCOME_PLIES) < (b & OUTCOME_PLIES);  // Виграємо швидше
+    return (a & OUTCOME_PLIES) > (b & OUTCOME_PLIES);              // Програємо якомога довше
+}
+
+// Межі карт на столі по мастях (0 - масть ще не на столі).
+// Код столу: 17 станів на масть (немає або lo 6..7 та hi 7..14).
+struct Frontier {
+    static const int TABLE_CODES = 83521;  // 17^4
+
+    int lo[4], hi[4];
+
+    // Стан однієї масті (0 - масть ще не на столі, 1-16)
+    int suitState(int suit) const {
+        return lo[suit] ? 1 + (lo[suit] - 6) * 8 + (hi[suit] - 7) : 0;
+    }
+
+    int code() const {
+        int code = 0;
+        for (int suit = 3; suit >= 0; suit--) code = code * 17 + suitState(suit);
+        return code;
+    }
+
+    static Frontier fromCode(int code) {
+        Frontier frontier;
+        for (int suit = 0; suit < 4; suit++) {
+            int state = code % 17;
+            code /= 17;
+            frontier.lo[suit] = state ? 6 + (state - 1) / 8 : 0;
+            frontier.hi[suit] = state ? 7 + (state - 1) % 8 : 0;
+        }
+        return frontier;
+    }
+
+    uint64_t tableMask() const {
+        uint64_t mask = 0;
+        for (int suit = 0; suit < 4; suit++) {
+            if (!lo[suit]) continue;
+            for (int rank = lo[suit]; rank <= hi[suit]; rank++) mask |= cardBit(rank, suit);
+        }
+        return mask;
+    }
+
+    // Карти, які зараз можна зіграти (незалежно від того, в кого вони)
+    uint64_t playableMask() const {
+        uint64_t mask = 0;
+        for (int suit = 0; suit < 4; suit++) {
+            if (!lo[suit]) {
+                mask |= cardBit(7, suit);
+                continue;
+            }
+            if (lo[suit] > 6) mask |= cardBit(lo[suit] - 1, suit);
+            if (hi[suit] < 14) mask |= cardBit(hi[suit] + 1, suit);
+        }
+        return mask;
+    }
+
+    // Можливі ходи з руки hand (не більше 8)
+    int generateMoves(uint64_t hand, Card* moves) const {
+        int n = 0;
+        for (int suit = 0; suit < 4; suit++) {
+            if (!lo[suit]) {
+                if (hand & cardBit(7, suit)) moves[n++] = {7, suit};
+                continue;
+            }
+            if (lo[suit] > 6 && (hand & cardBit(lo[suit] - 1, suit))) {
+                moves[n++] = {lo[suit] - 1, suit};
+            }
+            if (hi[suit] < 14 && (hand & cardBit(hi[suit] + 1, suit))) {
+                moves[n++] = {hi[suit] + 1, suit};
+            }
+        }
+        return n;
+    }
+
+    void play(const Card& card) {
+        if (!lo[card.suit]) lo[card.suit] = hi[card.suit] = card.rank;
+        else if (card.rank < lo[card.suit]) lo[card.suit] = card.rank;
+        else hi[card.suit] = card.rank;
+    }
+};
+
+// Симетрія мастей: правила не розрізняють масті, тож позиція визначається
+// з точністю до їх перестановки. Канонічний порядок - масті, відсортовані за
+// станом столу, а при рівності - за картами масті в масках (руки, виключення).
+// perm[канонічна масть] = початкова масть.
+static void canonicalSuits(const Frontier& frontier, const uint64_t* masks, int num_masks, int perm[4]) {
+    for (int i = 0; i < 4; i++) perm[i] = i;
+
+    // Сортування вставками (4 елементи), рівні масті лишаються в початковому порядку
+    for (int i = 1; i < 4; i++) {
+        for (int j = i; j > 0; j--) {
+            int a = perm[j - 1], b = perm[j];
+            int order = frontier.suitState(a) - frontier.suitState(b);
+            for (int m = 0; m < num_masks && order == 0; m++) {
+                uint64_t slice_a = (masks[m] >> (a * 9)) & 0x1FF;
+                uint64_t slice_b = (masks[m] >> (b * 9)) & 0x1FF;
+                order = slice_a < slice_b ? -1 : (slice_a > slice_b ? 1 : 0);
+            }
+            if (order <= 0) break;
+            swap(perm[j - 1], perm[j]);
+        }
+    }
+}
+
+static Frontier permuteFrontier(const Frontier& frontier, const int perm[4]) {
+    Frontier result;
+    for (int suit = 0; suit < 4; suit++) {
+        result.lo[suit] = frontier.lo[perm[suit]];
+        result.hi[suit] = frontier.hi[perm[suit]];
+    }
+    return result;
+}
+
+static uint64_t permuteMask(uint64_t mask, const int perm[4]) {
+    uint64_t result = 0;
+    for (int suit = 0; suit < 4; suit++) {
+        result |= ((mask >> (perm[suit] * 9)) & 0x1FF) << (suit * 9);
+    }
+    return result;
+}
+
+// Заголовок файлу таблиці ендшпілів
+struct TablebaseHeader {
+    char magic[4];          // "SVTB"
+    uint32_t version;
+    uint32_t max_cards;     // K - карт на руці кожного гравця
+    uint32_t table_codes;
+};
+
+// Таблиця ендшпілів для 2 гравців (ретроградний аналіз).
+//
+// Покриває всі позиції, де поза столом не більше 2 * K карт (зокрема всі,
+// де в обох гравців не більше K карт). Руки задаються кодом столу та
+// рукою гравця 0 - решта карт поза столом у гравця 1. Пропуск ходу -
+// лише вимушений, як у DealSolver.
+//
+// Зберігаються лише канонічні стани столу (стани мастей не спадають):
+// позиція спершу приводиться до канонічного порядку мастей (canonicalSuits),
+// що зменшує таблицю майже в 17 разів.
+//
+// Файл: TablebaseHeader, uint64_t offsets[TABLE_CODES + 1], uint8_t entries[].
+// Запис позиції - offsets[код столу] + (біти руки гравця 0 серед карт
+// поза столом) * 2 + хто ходить; значення - переможець << 7 | ходи до кінця.
+class Tablebase {
+public:
+    static const uint32_t VERSION = 2;  // 2 - лише канонічні стани столу
+    static const int MAX_CARDS_LIMIT = 7;  // K = 7 - вже ~300 МБ
+
+    const uint8_t* data;
+    size_t size;
+    int max_cards;
+    const uint64_t* offsets;
+    const uint8_t* entries;
+
+    Tablebase() : data(nullptr), size(0), max_cards(0), offsets(nullptr), entries(nullptr) {}
+    ~Tablebase() { unload(); }
+
+    static uint8_t pack(uint16_t outcome) {
+        return (uint8_t)(((outcome & OUTCOME_WINNER) ? 0x80 : 0) | (outcome & OUTCOME_PLIES));
+    }
+
+    static uint16_t unpack(uint8_t entry) {
+        return ((entry & 0x80) ? OUTCOME_WINNER : 0) | (entry & 0x7F);
+    }
+
+    static bool isCanonical(const Frontier& frontier) {
+        for (int suit = 1; suit < 4; suit++) {
+            if (frontier.suitState(suit - 1) > frontier.suitState(suit)) return false;
+        }
+        return true;
+    }
+
+    // Номер запису позиції після приведення до канонічного порядку мастей
+    // (UINT64_MAX - позиції немає в таблиці)
+    static uint64_t entryIndex(const Frontier& frontier, uint64_t hand0, int side, const uint64_t* offsets) {
+        int perm[4];
+        canonicalSuits(frontier, nullptr, 0, perm);
+        Frontier canonical = permuteFrontier(frontier, perm);
+
+        int code = canonical.code();
+        if (offsets[code] == offsets[code + 1]) return UINT64_MAX;
+
+        uint64_t rest = FULL_DECK & ~canonical.tableMask();
+        return offsets[code] + extractBits(permuteMask(hand0, perm), rest) * 2 + side;
+    }
+
+    // Обчислити таблицю для K = max_cards і записати у файл
+    static bool generate(const char* path, int max_cards) {
+        if (max_cards < 1 || max_cards > MAX_CARDS_LIMIT) return false;
+        int max_rest = 2 * max_cards;
+
+        // Коди столу групуються за кількістю карт поза столом: кожен хід
+        // веде до коду з меншою кількістю, який уже обчислено
+        vector<uint64_t> offsets(Frontier::TABLE_CODES + 1);
+        vector<vector<int>> by_rest(max_rest + 1);
+        uint64_t total = 0;
+        for (int code = 0; code < Frontier::TABLE_CODES; code++) {
+            offsets[code] = total;
+            Frontier frontier = Frontier::fromCode(code);
+            int rest = 36 - __builtin_popcountll(frontier.tableMask());
+            if (rest <= max_rest && isCanonical(frontier)) {
+                by_rest[rest].push_back(code);
+                total += 2ULL << rest;
+            }
+        }
+        offsets[Frontier::TABLE_CODES] = total;
+
+        vector<uint8_t> entries(total);
+        for (int rest_count = 0; rest_count <= max_rest; rest_count++) {
+            for (int code : by_rest[rest_count]) {
+                Frontier frontier = Frontier::fromCode(code);
+                uint64_t rest = FULL_DECK & ~frontier.tableMask();
+                uint8_t* entry = &entries[offsets[code]];
+
+                // Перебір підмножин rest у порядку зростання їх стиснутих бітів
+                uint64_t hand0 = 0;
+                do {
+                    uint64_t hands[2] = {hand0, rest & ~hand0};
+                    // Спочатку гравець з ходами: пропуск посилається на його запис
+                    Card moves[8];
+                    int first = frontier.generateMoves(hands[0], moves) ? 0 : 1;
+                    for (int k = 0; k < 2; k++) {
+                        int side = first ^ k;
+                        entry[side] = pack(solveEntry(frontier, hands, side, entry, offsets, entries));
+                    }
+                    entry += 2;
+                    hand0 = (hand0 - rest) & rest;
+                } while (hand0);
+            }
+        }
+
+        TablebaseHeader header = {{'S', 'V', 'T', 'B'}, VERSION, (uint32_t)max_cards,
+                                  (uint32_t)Frontier::TABLE_CODES};
+        string tmp_path = string(path) + ".tmp";
+        FILE* file = fopen(tmp_path.c_str(), "wb");
+        if (!file) return false;
+        bool ok = fwrite(&header, sizeof(header), 1, file) == 1
+            && fwrite(offsets.data(), sizeof(uint64_t), offsets.size(), file) == offsets.size()
+            && fwrite(entries.data(), 1, entries.size(), file) == entries.size();
+        ok = fclose(file) == 0 && ok;
+        if (!ok || rename(tmp_path.c_str(), path) != 0) {
+            remove(tmp_path.c_str());
+            return false;
+        }
+        return true;
+    }
+
+    // Результат позиції, якщо записи всіх наступних позицій уже обчислені
+    static uint16_t solveEntry(const Frontier& frontier, const uint64_t hands[2],
+                               int side, const uint8_t* entry, const vector<uint64_t>& offsets,
+                               const vector<uint8_t>& entries) {
+        if (!hands[0] && !hands[1]) {
+            // Стіл повний: переміг той, хто зіграв останню карту
+            return side ? 0 : OUTCOME_WINNER;
+        }
+        if (!hands[0] || !hands[1]) {
+            return hands[0] ? OUTCOME_WINNER : 0;
+        }
+
+        Card moves[8];
+        int n = frontier.generateMoves(hands[side], moves);
+        if (n == 0) {
+            // Поза столом є карти, тож суперник точно має хід
+            return addPly(unpack(entry[1 - side]));
+        }
+
+        uint16_t best = 0;
+        for (int i = 0; i < n; i++) {
+            Frontier next = frontier;
+            next.play(moves[i]);
+            uint64_t next_hand0 = hands[0] & ~cardBit(moves[i].rank, moves[i].suit);
+
+            uint64_t index = entryIndex(next, next_hand0, 1 - side, offsets.data());
+            uint16_t result = addPly(unpack(entries[index]));
+            if (i == 0 || betterOutcome(result, best, side)) best = result;
+        }
+        return best;
+    }
+
+    bool load(const char* path) {
+        unload();
+
+        int fd = open(path, O_RDONLY);
+        if (fd < 0) return false;
+        struct stat st;
+        if (fstat(fd, &st) != 0 || (size_t)st.st_size < sizeof(TablebaseHeader)) {
+            close(fd);
+            return false;
+        }
+        void* mapped = mmap(nullptr, st.st_size, PROT_READ, MAP_SHARED, fd, 0);
+        close(fd);
+        if (mapped == MAP_FAILED) return false;
+
+        data = static_cast<const uint8_t*>(mapped);
+        size = st.st_size;
+
+        const TablebaseHeader* header = reinterpret_cast<const TablebaseHeader*>(data);
+        size_t entries_start = sizeof(TablebaseHeader) + sizeof(uint64_t) * (Frontier::TABLE_CODES + 1);
+        if (memcmp(header->magic, "SVTB", 4) != 0 || header->version != VERSION
+            || header->table_codes != (uint32_t)Frontier::TABLE_CODES || size < entries_start) {
+            unload();
+            return false;
+        }
+
+        offsets = reinterpret_cast<const uint64_t*>(data + sizeof(TablebaseHeader));
+        entries = data + entries_start;
+        if (offsets[Frontier::TABLE_CODES] != size - entries_start) {
+            unload();
+            return false;
+        }
+        max_cards = header->max_cards;
+        return true;
+    }
+
+    void unload() {
+        if (data) munmap(const_cast<uint8_t*>(data), size);
+        data = nullptr;
+        size = 0;
+        max_cards = 0;
+        offsets = nullptr;
+        entries = nullptr;
+    }
+
+    // Результат позиції (-1 - позиції немає в таблиці)
+    int lookup(const Frontier& frontier, const uint64_t hands[2], int side) const {
+        if (!data) return -1;
+
+        uint64_t rest = FULL_DECK & ~frontier.tableMask();
+        if ((hands[0] | hands[1]) != rest || (hands[0] & hands[1])) return -1;
+
+        uint64_t index = entryIndex(frontier, hands[0], side, offsets);
+        if (index == UINT64_MAX) return -1;
+        return unpack(entries[index]);
+    }
+
+    // Найкращий хід гравця side за таблицею (false - позиції немає або немає ходів)
+    bool bestMove(const Frontier& frontier, const uint64_t hands[2], int side, Card* best_move) const {
+        Card moves[8];
+        int n = frontier.generateMoves(hands[side], moves);
+        if (n == 0 || lookup(frontier, hands, side) < 0) return false;
+
+        uint16_t best = 0;
+        for (int i = 0; i < n; i++) {
+            Frontier next = frontier;
+            next.play(moves[i]);
+            uint64_t next_hands[2] = {hands[0], hands[1]};
+            next_hands[side] &= ~cardBit(moves[i].rank, moves[i].suit);
+
+            uint16_t result = addPly((uint16_t)lookup(next, next_hands, 1 - side));
+            if (i == 0 || betterOutcome(result, best, side)) {
+                best = result;
+                *best_move = moves[i];
+            }
+        }
+        return true;
+    }
+};
+
+// Таблиця ендшпілів, спільна для всіх ігор (game_tablebase_load)
+static Tablebase g_tablebase;
+
+// Рівномірна вибірка прихованих рук суперників, сумісна з пропусками ходів.
+//
+// Пропуск доводить, що гравець не має жодної карти, яку тоді можна було
+// зіграти (виключення гравця). Приховані карти групуються за множиною
+// суперників, які можуть їх мати (не більше 7 груп для 3 суперників).
+// Кількість сумісних розподілів рахується динамікою по групах і вільних
+// місцях у руках, тож кожна вибірка рівномірна серед усіх сумісних
+// розподілів і не потребує відкидання.
+class HandSampler {
+public:
+    static const int MAX_OPPONENTS = 3;
+
+    struct Split {
+        int k[MAX_OPPONENTS];  // Скільки карт групи отримує кожен суперник
+        int index;             // Ті самі числа як зміщення у стані місць
+        double weight;         // Кількість способів вибрати карти групи
+    };
+
+    int num_opponents;
+    int counts[MAX_OPPONENTS];
+    int strides[MAX_OPPONENTS];
+    int full_state;
+    int states;                    // Кількість станів вільних місць
+    vector<vector<int>> groups;    // Індекси карт кожної групи
+    vector<vector<Split>> splits;  // Розподіли кожної групи між суперниками
+    vector<double> memo;           // (група, вільні місця) -> кількість розподілів
+    bool consistent;
+
+    // hand_sizes та exclusions - для кожного з num_opponents суперників
+    HandSampler(uint64_t hidden, int opponents, const int* hand_sizes, const uint64_t* exclusions)
+        : num_opponents(opponents), full_state(0), states(1), consistent(false) {
+        if (opponents < 1 || opponents > MAX_OPPONENTS) return;
+
+        int total = 0;
+        for (int i = 0; i < MAX_OPPONENTS; i++) {
+            counts[i] = i < opponents ? hand_sizes[i] : 0;
+            strides[i] = states;
+            full_state += counts[i] * states;
+            states *= counts[i] + 1;
+            total += counts[i];
+        }
+        if (total != __builtin_popcountll(hidden)) return;
+
+        // Групи карт за множиною суперників, які можуть їх мати
+        int group_of_set[1 << MAX_OPPONENTS];
+        fill(group_of_set, group_of_set + (1 << MAX_OPPONENTS), -1);
+        vector<int> group_sets;
+        for (int card = 0; card < 64; card++) {
+            if (!(hidden & (1ULL << card))) continue;
+            int set = 0;
+            for (int i = 0; i < opponents; i++) {
+                if (!(exclusions[i] & (1ULL << card))) set |= 1 << i;
+            }
+            if (!set) return;  // Карту не може мати жоден суперник
+            if (group_of_set[set] < 0) {
+                group_of_set[set] = groups.size();
+                groups.push_back(vector<int>());
+                group_sets.push_back(set);
+            }
+            groups[group_of_set[set]].push_back(card);
+        }
+
+        for (size_t g = 0; g < groups.size(); g++) {
+            splits.push_back(groupSplits(groups[g].size(), group_sets[g]));
+        }
+        memo.assign((groups.size() + 1) * states, -1.0);
+        consistent = ways(0, full_state) > 0;
+    }
+
+    static double factorial(int n) {
+        double result = 1;
+        for (int i = 2; i <= n; i++) result *= i;
+        return result;
+    }
+
+    // Всі розподіли n карт групи між суперниками з множини set
+    vector<Split> groupSplits(int n, int set) const {
+        vector<Split> result;
+        for (int k0 = 0; k0 <= ((set & 1) ? min(n, counts[0]) : 0); k0++) {
+            for (int k1 = 0; k1 <= ((set & 2) ? min(n - k0, counts[1]) : 0); k1++) {
+                int k2 = n - k0 - k1;
+                if (k2 > ((set & 4) ? counts[2] : 0)) continue;
+
+                Split split = {{k0, k1, k2}, k0 * strides[0] + k1 * strides[1] + k2 * strides[2],
+                               factorial(n) / (factorial(k0) * factorial(k1) * factorial(k2))};
+                result.push_back(split);
+            }
+        }
+        return result;
+    }
+
+    bool fits(const Split& split, int state) const {
+        for (int i = 0; i < num_opponents; i++) {
+            if ((state / strides[i]) % (counts[i] + 1) < split.k[i]) return false;
+        }
+        return true;
+    }
+
+    // Кількість розподілів груп g.. , що заповнюють вільні місця state
+    double ways(size_t g, int state) {
+        if (g == groups.size()) return state == 0 ? 1.0 : 0.0;
+
+        double& cached = memo[g * states + state];
+        if (cached >= 0) return cached;
+
+        double total = 0;
+        for (const Split& split : splits[g]) {
+            if (fits(split, state)) total += split.weight * ways(g + 1, state - split.index);
+        }
+        cached = total;
+        return total;
+    }
+
+    // Один рівномірний розподіл: hands[i] - карти i-го суперника
+    void sample(uint64_t& rng_state, uint64_t* hands) {
+        for (int i = 0; i < num_opponents; i++) hands[i] = 0;
+
+        int state = full_state;
+        for (size_t g = 0; g < groups.size(); g++) {
+            double r = (splitmix64(rng_state) >> 11) * (1.0 / 9007199254740992.0) * ways(g, state);
+
+            const Split* chosen = nullptr;
+            for (const Split& split : splits[g]) {
+                if (!fits(split, state)) continue;
+                double w = split.weight * ways(g + 1, state - split.index);
+                if (w <= 0) continue;
+                chosen = &split;
+                if (r < w) break;
+                r -= w;
+            }
+
+            // Випадкові карти групи в потрібній кількості кожному супернику
+            vector<int>& cards = groups[g];
+            int pos = 0, n = cards.size();
+            for (int i = 0; i < num_opponents; i++) {
+                for (int j = 0; j < chosen->k[i]; j++, pos++) {
+                    int pick = pos + (int)(splitmix64(rng_state) % (uint64_t)(n - pos));
+                    swap(cards[pos], cards[pick]);
+                    hands[i] |= 1ULL << cards[pos];
+                }
+            }
+            state -= chosen->index;
+        }
+    }
+};
+
 // Внутрішній клас гри
 class SevenGameEngine {
 public:
+    // Ряд карт однієї масті на столі (low = 0 - ряд ще не почато).
+    // Кожна колода дає масті свій ряд, який починається її сімкою.
+    struct Row {
+        int low, high;
+    };
+
     int num_players;
+    int min_rank, max_rank, num_decks;
+    int ranks;  // Рангів у масті
     int current_player;
     vector<vector<Card>> player_hands;
-    map<int, pair<int, int>> table;  // suit -> (min_rank, max_rank)
+    vector<Row> rows;  // Ряд масті suit з колоди d - rows[suit * num_decks + d]
     vector<int> consecutive_passes;
+    vector<uint64_t> pass_exclusions;  // Карти, яких гравець точно не має (за його пропусками)
+    mt19937 rng;  // Генератор для AI
+    EventLog events;
+    bool game_over;
 
-    SevenGameEngine(int players) : num_players(players), current_player(0) {
+    SevenGameEngine(int players, int low_rank = 6, int high_rank = 14, int decks = 1)
+        : num_players(players), min_rank(low_rank), max_rank(high_rank), num_decks(decks),
+          ranks(high_rank - low_rank + 1), current_player(0), game_over(false) {
         player_hands.resize(players);
+        rows.resize(4 * decks, {0, 0});
         consecutive_passes.resize(players, 0);
+        pass_exclusions.resize(players, 0);
+        random_device rd;
+        rng.seed(rd());
     }
 
-    void dealCards() {
-        vector<Card> deck;
+    static bool validConfig(const GameConfig& config) {
+        int ranks = config.max_rank - config.min_rank + 1;
+        return config.num_players >= 2 && config.num_players <= 8
+            && config.min_rank >= 2 && config.min_rank <= 7
+            && config.max_rank >= 7 && config.max_rank <= 14
+            && config.num_decks >= 1 && config.num_decks <= 4
+            && 4 * ranks * config.num_decks >= config.num_players;
+    }
 
-        // Створюємо колоду
-        for (int suit = 0; suit < 4; suit++) {
-            for (int rank = 6; rank <= 14; rank++) {
-                deck.push_back({rank, suit});
+    // Стандартна гра: одна колода з 36 карт (6-туз)
+    bool isStandard() const {
+        return min_rank == 6 && max_rank == 14 && num_decks == 1;
+    }
+
+    // Бітові маски карт (біт suit * ranks + (rank - min_rank)) - лише для
+    // однієї колоди; для 36 карт це той самий біт, що й cardBit
+    bool masksSupported() const {
+        return num_decks == 1 && 4 * ranks <= 64;
+    }
+
+    uint64_t maskBit(int rank, int suit) const {
+        return 1ULL << (suit * ranks + (rank - min_rank));
+    }
+
+    uint64_t deckMask() const {
+        return (1ULL << (4 * ranks)) - 1;
+    }
+
+    vector<Card> createDeck() {
+        vector<Card> deck;
+        for (int d = 0; d < num_decks; d++) {
+            for (int suit = 0; suit < 4; suit++) {
+                for (int rank = min_rank; rank <= max_rank; rank++) {
+                    deck.push_back({rank, suit});
+                }
             }
         }
+        return deck;
+    }
+
+    void dealCards() {
+        vector<Card> deck = createDeck();
 
         // Перемішуємо
-        random_device rd;
-        mt19937 g(rd());
-        shuffle(deck.begin(), deck.end(), g);
+        shuffle(deck.begin(), deck.end(), rng);
+        dealFromDeck(deck);
+    }
+
+    void dealCardsSeeded(uint64_t seed) {
+        vector<Card> deck = createDeck();
+
+        // Fisher-Yates з splitmix64 - однаковий результат на всіх платформах
+        uint64_t state = seed;
+        for (int i = (int)deck.size() - 1; i > 0; i--) {
+            int j = (int)(splitmix64(state) % (uint64_t)(i + 1));
+            swap(deck[i], deck[j]);
+        }
+
+        // AI теж стає відтворюваним
+        rng.seed((uint32_t)(seed ^ (seed >> 32)));
+        dealFromDeck(deck);
+    }
+
+    void dealFromDeck(vector<Card>& deck) {
+        // Нова роздача починає гру заново
+        fill(rows.begin(), rows.end(), Row{0, 0});
+        current_player = 0;
+        game_over = false;
+        for (int p = 0; p < num_players; p++) {
+            player_hands[p].clear();
+            consecutive_passes[p] = 0;
+            pass_exclusions[p] = 0;
+        }
 
-        // Роздаємо карти
-        int cards_per_player = 36 / num_players;
+        // Роздаємо карти; якщо порівну не ділиться, перші гравці отримують на карту більше
+        int cards_per_player = deck.size() / num_players;
+        int extra_cards = deck.size() % num_players;
         for (int p = 0; p < num_players; p++) {
-            for (int i = 0; i < cards_per_player; i++) {
+            int count = cards_per_player + (p < extra_cards ? 1 : 0);
+            for (int i = 0; i < count; i++) {
                 player_hands[p].push_back(deck.back());
                 deck.pop_back();
             }
@@ -58,6 +730,39 @@ public:
                     return a.rank < b.rank;
                 });
         }
+
+        events.push(EVENT_DEAL, -1);
+        events.push(EVENT_TURN, current_player);
+    }
+
+    // Подія після ходу: кінець гри (один раз) або перехід ходу
+    void pushTurnEvents() {
+        if (!events.enabled || game_over) return;
+
+        int winner = checkWinner();
+        if (winner != -1) {
+            game_over = true;
+            events.push(EVENT_GAME_OVER, winner);
+        } else {
+            events.push(EVENT_TURN, current_player);
+        }
+    }
+
+    // Ряд, на який можна покласти карту (-1 - немає)
+    int targetRow(const Card& card) const {
+        if (card.suit < 0 || card.suit > 3) return -1;
+
+        for (int d = 0; d < num_decks; d++) {
+            int index = card.suit * num_decks + d;
+            const Row& row = rows[index];
+            // Сімка починає ще не почату масть (ряд своєї колоди)
+            if (card.rank == 7) {
+                if (!row.low) return index;
+            } else if (row.low && (card.rank == row.low - 1 || card.rank == row.high + 1)) {
+                return index;
+            }
+        }
+        return -1;
     }
 
     bool canPlayCard(int player_id, Card card) {
@@ -72,19 +777,7 @@ public:
         }
         if (!has_card) return false;
 
-        // Сімку можна грати завжди, якщо масть ще не на столі
-        if (card.rank == 7) {
-            return table.find(card.suit) == table.end();
-        }
-
-        // Перевірка чи можна покласти карту
-        auto it = table.find(card.suit);
-        if (it == table.end()) return false;
-
-        int min_rank = it->second.first;
-        int max_rank = it->second.second;
-
-        return (card.rank == min_rank - 1) || (card.rank == max_rank + 1);
+        return targetRow(card) != -1;
     }
 
     bool playCard(int player_id, Card card) {
@@ -100,25 +793,32 @@ public:
         }
 
         // Оновлюємо стіл
-        if (table.find(card.suit) == table.end()) {
-            table[card.suit] = {card.rank, card.rank};
+        Row& row = rows[targetRow(card)];
+        if (!row.low) {
+            row.low = row.high = card.rank;
+        } else if (card.rank < row.low) {
+            row.low = card.rank;
         } else {
-            if (card.rank < table[card.suit].first) {
-                table[card.suit].first = card.rank;
-            }
-            if (card.rank > table[card.suit].second) {
-                table[card.suit].second = card.rank;
-            }
+            row.high = card.rank;
         }
 
         consecutive_passes[player_id] = 0;
         current_player = (current_player + 1) % num_players;
+
+        events.push(EVENT_CARD_PLAYED, player_id, card);
+        pushTurnEvents();
         return true;
     }
 
     void passTurn() {
+        events.push(EVENT_PASS, current_player);
+
+        // Пропуск означає, що жодної з можливих зараз карт у гравця немає
+        // (пропуск вимушений, як у computerMove та GUI)
+        if (masksSupported()) pass_exclusions[current_player] |= playableMask();
         consecutive_passes[current_player]++;
         current_player = (current_player + 1) % num_players;
+        pushTurnEvents();
     }
 
     int checkWinner() {
@@ -169,15 +869,211 @@ public:
             return false;
         }
 
+        // В ендшпілі 2 гравців - найкращий хід з таблиці, якщо вона завантажена
+        if (num_players == 2 && g_tablebase.data && isStandard()) {
+            uint64_t hands[2] = {handMask(0), handMask(1)};
+            if (g_tablebase.bestMove(frontier(), hands, current_player, played_card)) {
+                playCard(current_player, *played_card);
+                return true;
+            }
+        }
+
         // Вибираємо випадковий хід
-        random_device rd;
-        mt19937 g(rd());
         uniform_int_distribution<> dis(0, valid_moves.size() - 1);
 
-        *played_card = valid_moves[dis(g)];
+        *played_card = valid_moves[dis(rng)];
         playCard(current_player, *played_card);
         return true;
     }
+
+    // Оцінка ходу: скільки з rollouts випадкових доігрувань виграє поточний гравець,
+    // якщо зіграє card. Карти суперників перед кожним доігруванням випадково
+    // перерозподіляються (гравець не бачить чужих карт).
+    int rolloutWins(Card card, int rollouts, uint64_t seed) {
+        int player = current_player;
+        if (!canPlayCard(player, card)) return -1;
+
+        mt19937 gen((uint32_t)(seed ^ (seed >> 32)));
+        vector<Card> hidden;
+        for (int p = 0; p < num_players; p++) {
+            if (p != player) hidden.insert(hidden.end(), player_hands[p].begin(), player_hands[p].end());
+        }
+
+        // Руки суперників вибираються сумісно з їхніми пропусками; якщо
+        // сумісного розподілу немає (добровільні пропуски) або масок не
+        // підтримує конфігурація гри - просто перемішуються
+        HandSampler sampler = handSampler(player);
+        uint64_t sample_state = seed;
+        uint64_t sampled[HandSampler::MAX_OPPONENTS];
+
+        int wins = 0;
+        for (int r = 0; r < rollouts; r++) {
+            SevenGameEngine sim(*this);
+            sim.rng.seed(gen());
+
+            if (sampler.consistent) {
+                sampler.sample(sample_state, sampled);
+                int idx = 0;
+                for (int p = 0; p < num_players; p++) {
+                    if (p != player) sim.setHand(p, sampled[idx++]);
+                }
+            } else {
+                shuffle(hidden.begin(), hidden.end(), gen);
+                int idx = 0;
+                for (int p = 0; p < num_players; p++) {
+                    if (p == player) continue;
+                    for (auto& c : sim.player_hands[p]) c = hidden[idx++];
+                }
+            }
+
+            sim.playCard(player, card);
+            Card played;
+            while (sim.checkWinner() == -1) sim.computerMove(&played);
+            if (sim.checkWinner() == player) wins++;
+        }
+        return wins;
+    }
+
+    // Маска карт руки (0, якщо маски не підтримуються)
+    uint64_t handMask(int player_id) const {
+        if (!masksSupported()) return 0;
+
+        uint64_t mask = 0;
+        for (const auto& c : player_hands[player_id]) {
+            mask |= maskBit(c.rank, c.suit);
+        }
+        return mask;
+    }
+
+    uint64_t tableMask() const {
+        uint64_t mask = 0;
+        for (int suit = 0; suit < 4; suit++) {
+            const Row& row = rows[suit];
+            if (!row.low) continue;
+            for (int rank = row.low; rank <= row.high; rank++) mask |= maskBit(rank, suit);
+        }
+        return mask;
+    }
+
+    // Карти, які зараз можна зіграти (незалежно від того, в кого вони)
+    uint64_t playableMask() const {
+        uint64_t mask = 0;
+        for (int suit = 0; suit < 4; suit++) {
+            const Row& row = rows[suit];
+            if (!row.low) {
+                mask |= maskBit(7, suit);
+                continue;
+            }
+            if (row.low > min_rank) mask |= maskBit(row.low - 1, suit);
+            if (row.high < max_rank) mask |= maskBit(row.high + 1, suit);
+        }
+        return mask;
+    }
+
+    // Замінити руку гравця картами з маски (у порядку сортування роздачі)
+    void setHand(int player_id, uint64_t mask) {
+        auto& hand = player_hands[player_id];
+        hand.clear();
+        for (int bit = 0; bit < 4 * ranks; bit++) {
+            if (mask & (1ULL << bit)) hand.push_back({min_rank + bit % ranks, bit / ranks});
+        }
+    }
+
+    // Вибірка рук суперників з точки зору гравця observer
+    // (consistent = false, якщо маски або кількість гравців не підтримуються)
+    HandSampler handSampler(int observer) const {
+        int sizes[HandSampler::MAX_OPPONENTS];
+        uint64_t exclusions[HandSampler::MAX_OPPONENTS];
+        if (!masksSupported()) return HandSampler(0, 0, sizes, exclusions);
+        uint64_t hidden = deckMask() & ~tableMask() & ~handMask(observer);
+
+        int n = 0;
+        for (int p = 0; p < num_players && n < HandSampler::MAX_OPPONENTS; p++) {
+            if (p == observer) continue;
+            sizes[n] = player_hands[p].size();
+            exclusions[n] = pass_exclusions[p];
+            n++;
+        }
+        return HandSampler(hidden, num_players - 1, sizes, exclusions);
+    }
+
+    // Межі столу для розв'язувача та таблиці ендшпілів (лише стандартна гра)
+    Frontier frontier() const {
+        Frontier result;
+        for (int suit = 0; suit < 4; suit++) {
+            result.lo[suit] = rows[suit].low;
+            result.hi[suit] = rows[suit].high;
+        }
+        return result;
+    }
+};
+
+// Точний розв'язувач для 2 гравців з повною інформацією.
+// Пропуск ходу - лише коли немає можливих ходів (як у computerMove).
+// Руки однозначно визначаються роздачею та станом столу, тому позиція -
+// це код столу (17 станів на масть) та гравець, який ходить.
+class DealSolver {
+public:
+    static const uint16_t KNOWN = 0x8000;
+    static const uint16_t WINNER = OUTCOME_WINNER;
+    static const uint16_t PLIES = OUTCOME_PLIES;
+
+    uint64_t hands[2];
+    Frontier frontier;
+    vector<uint16_t> memo;   // KNOWN | результат позиції
+
+    DealSolver(const SevenGameEngine& engine)
+        : frontier(engine.frontier()), memo(Frontier::TABLE_CODES * 2, 0) {
+        hands[0] = engine.handMask(0);
+        hands[1] = engine.handMask(1);
+    }
+
+    uint16_t solve(int side) {
+        int code = frontier.code();
+        uint16_t cached = memo[code * 2 + side];
+        if (cached) return cached & ~KNOWN;
+
+        // Ендшпіль є в таблиці - пошук не потрібен
+        int known = g_tablebase.lookup(frontier, hands, side);
+        if (known >= 0) return (uint16_t)known;
+
+        Card moves[8];
+        int n = frontier.generateMoves(hands[side], moves);
+        uint16_t best;
+
+        if (n == 0) {
+            Card other[8];
+            if (frontier.generateMoves(hands[1 - side], other) == 0) {
+                // Всі пропустили: перемагає гравець з меншою кількістю карт
+                int winner = __builtin_popcountll(hands[1]) < __builtin_popcountll(hands[0]) ? 1 : 0;
+                best = (winner ? WINNER : 0) | 2;
+            } else {
+                best = addPly(solve(1 - side));
+            }
+        } else {
+            best = 0;
+            for (int i = 0; i < n; i++) {
+                const Card& card = moves[i];
+                Frontier saved = frontier;
+                uint64_t bit = cardBit(card.rank, card.suit);
+
+                frontier.play(card);
+                hands[side] &= ~bit;
+
+                uint16_t result = hands[side] == 0
+                    ? (uint16_t)((side ? WINNER : 0) | 1)
+                    : addPly(solve(1 - side));
+
+                hands[side] |= bit;
+                frontier = saved;
+
+                if (i == 0 || betterOutcome(result, best, side)) best = result;
+            }
+        }
+
+        memo[code * 2 + side] = best | KNOWN;
+        return best;
+    }
 };
 
 // C API реалізація
@@ -186,31 +1082,54 @@ void* game_create(int num_players) {
     return new SevenGameEngine(num_players);
 }
 
+void* game_create_ex(const GameConfig* config) {
+    if (!config || !SevenGameEngine::validConfig(*config)) return nullptr;
+    return new SevenGameEngine(config->num_players, config->min_rank, config->max_rank,
+                               config->num_decks);
+}
+
+void game_get_config(void* game, GameConfig* config) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    config->num_players = engine->num_players;
+    config->min_rank = engine->min_rank;
+    config->max_rank = engine->max_rank;
+    config->num_decks = engine->num_decks;
+}
+
+void* game_clone(void* game) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    return new SevenGameEngine(*engine);
+}
+
 void game_deal_cards(void* game) {
     SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
     engine->dealCards();
 }
 
+void game_deal_cards_seeded(void* game, unsigned long long seed) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    engine->dealCardsSeeded(seed);
+}
+
 void game_get_state(void* game, GameState* state) {
     SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
 
+    // Структура фіксованого розміру: перші 4 гравці та перший ряд кожної масті
+    // (не більше 9 карт); повний стан - game_get_state_ex
     state->current_player = engine->current_player;
     state->num_players = engine->num_players;
 
-    for (int i = 0; i < engine->num_players; i++) {
+    for (int i = 0; i < engine->num_players && i < 4; i++) {
         state->player_cards_count[i] = engine->player_hands[i].size();
     }
 
     for (int suit = 0; suit < 4; suit++) {
         state->table_card_count[suit] = 0;
 
-        auto it = engine->table.find(suit);
-        if (it != engine->table.end()) {
-            int min_rank = it->second.first;
-            int max_rank = it->second.second;
-
+        const SevenGameEngine::Row& row = engine->rows[suit * engine->num_decks];
+        if (row.low) {
             int idx = 0;
-            for (int rank = min_rank; rank <= max_rank; rank++) {
+            for (int rank = row.low; rank <= row.high && idx < 9; rank++) {
                 state->table_state[suit][idx].rank = rank;
                 state->table_state[suit][idx].suit = suit;
                 idx++;
@@ -220,6 +1139,34 @@ void game_get_state(void* game, GameState* state) {
     }
 }
 
+int game_get_state_ex(void* game, GameStateEx* state) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+
+    if (state->version != GAME_STATE_EX_VERSION) return -1;
+
+    int num_rows = engine->rows.size();
+    state->current_player = engine->current_player;
+    state->num_players = engine->num_players;
+    state->num_rows = num_rows;
+    if (state->player_capacity < engine->num_players || state->row_capacity < num_rows) return 0;
+
+    for (int i = 0; i < engine->num_players; i++) {
+        state->player_cards_count[i] = engine->player_hands[i].size();
+    }
+    for (int r = 0; r < num_rows; r++) {
+        state->row_low[r] = engine->rows[r].low;
+        state->row_high[r] = engine->rows[r].high;
+    }
+    return 1;
+}
+
+int game_get_player_card_count(void* game, int player_id) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+
+    if (player_id < 0 || player_id >= engine->num_players) return 0;
+    return engine->player_hands[player_id].size();
+}
+
 int game_get_player_cards(void* game, int player_id, Card* cards, int max_cards) {
     SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
 
@@ -233,6 +1180,13 @@ int game_get_player_cards(void* game, int player_id, Card* cards, int max_cards)
     return count;
 }
 
+unsigned long long game_get_hand_mask(void* game, int player_id) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+
+    if (player_id < 0 || player_id >= engine->num_players) return 0;
+    return engine->handMask(player_id);
+}
+
 int game_can_play_card(void* game, int player_id, Card card) {
     SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
     return engine->canPlayCard(player_id, card) ? 1 : 0;
@@ -263,6 +1217,119 @@ int game_computer_move(void* game, Card* played_card) {
     return engine->computerMove(played_card) ? 1 : 0;
 }
 
+int game_play_out(void* game) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    Card played;
+    while (engine->checkWinner() == -1) engine->computerMove(&played);
+    return engine->checkWinner();
+}
+
+int game_rollout_wins(void* game, Card card, int rollouts, unsigned long long seed) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    return engine->rolloutWins(card, rollouts, seed);
+}
+
+int game_solve(void* game, int* plies) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    if (plies) *plies = 0;
+
+    if (engine->num_players != 2 || !engine->isStandard()) return -1;
+
+    int winner = engine->checkWinner();
+    if (winner != -1) return winner;
+
+    DealSolver solver(*engine);
+    uint16_t result = solver.solve(engine->current_player);
+    if (plies) *plies = result & DealSolver::PLIES;
+    return (result & DealSolver::WINNER) ? 1 : 0;
+}
+
+void game_canonicalize(int* lo, int* hi, unsigned long long* masks, int num_masks, int* perm) {
+    Frontier frontier;
+    for (int suit = 0; suit < 4; suit++) {
+        frontier.lo[suit] = lo[suit];
+        frontier.hi[suit] = hi[suit];
+    }
+
+    vector<uint64_t> original(masks, masks + num_masks);
+    canonicalSuits(frontier, original.data(), num_masks, perm);
+
+    Frontier canonical = permuteFrontier(frontier, perm);
+    for (int suit = 0; suit < 4; suit++) {
+        lo[suit] = canonical.lo[suit];
+        hi[suit] = canonical.hi[suit];
+    }
+    for (int i = 0; i < num_masks; i++) masks[i] = permuteMask(original[i], perm);
+}
+
+int game_tablebase_generate(const char* path, int max_cards) {
+    return Tablebase::generate(path, max_cards) ? 1 : 0;
+}
+
+int game_tablebase_load(const char* path) {
+    return g_tablebase.load(path) ? 1 : 0;
+}
+
+void game_tablebase_unload(void) {
+    g_tablebase.unload();
+}
+
+int game_tablebase_max_cards(void) {
+    return g_tablebase.max_cards;
+}
+
+int game_tablebase_probe(void* game, int* plies) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    if (plies) *plies = 0;
+
+    if (engine->num_players != 2 || !engine->isStandard()) return -1;
+
+    int winner = engine->checkWinner();
+    if (winner != -1) return winner;
+
+    uint64_t hands[2] = {engine->handMask(0), engine->handMask(1)};
+    int result = g_tablebase.lookup(engine->frontier(), hands, engine->current_player);
+    if (result < 0) return -1;
+    if (plies) *plies = result & OUTCOME_PLIES;
+    return (result & OUTCOME_WINNER) ? 1 : 0;
+}
+
+unsigned long long game_get_pass_exclusions(void* game, int player_id) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+
+    if (player_id < 0 || player_id >= engine->num_players) return 0;
+    return engine->pass_exclusions[player_id];
+}
+
+int game_sample_hands(void* game, int observer, unsigned long long seed,
+                      int num_samples, unsigned long long* out_hands) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+
+    if (observer < 0 || observer >= engine->num_players || num_samples < 0) return -1;
+    if (engine->num_players - 1 > HandSampler::MAX_OPPONENTS || !engine->masksSupported()) return -1;
+
+    HandSampler sampler = engine->handSampler(observer);
+    if (!sampler.consistent) return 0;
+
+    uint64_t state = seed;
+    uint64_t own = engine->handMask(observer);
+    uint64_t sampled[HandSampler::MAX_OPPONENTS];
+    for (int i = 0; i < num_samples; i++) {
+        sampler.sample(state, sampled);
+        unsigned long long* hands = out_hands + (size_t)i * engine->num_players;
+        int idx = 0;
+        for (int p = 0; p < engine->num_players; p++) {
+            hands[p] = p == observer ? own : sampled[idx++];
+        }
+    }
+    return num_samples;
+}
+
+int game_poll_events(void* game, uint64_t since_seq, Event* out, int max_events) {
+    SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
+    return engine->events.poll(since_seq, out, max_events);
+}
+
 void game_destroy(void* game) {
     SevenGameEngine* engine = static_cast<SevenGameEngine*>(game);
     delete engine;
@@ -9,6 +9,8 @@
 #ifndef SEVEN_GAME_LIB_H
 #define SEVEN_GAME_LIB_H
 
+#include <stdint.h>
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -19,7 +21,16 @@ typedef struct {
     int suit;  // 0-3 (Hearts, Diamonds, Clubs, Spades)
 } Card;
 
-// Структура для опису стану гри
+// Параметри гри для game_create_ex
+typedef struct {
+    int num_players;  // 2-8
+    int min_rank;     // Найменший ранг колоди, 2-7 (стандартно 6)
+    int max_rank;     // Найбільший ранг колоди, 7-14 (стандартно 14)
+    int num_decks;    // Кількість колод, 1-4 (кожна колода дає масті свій ряд)
+} GameConfig;
+
+// Стан гри фіксованого розміру (стандартна гра до 4 гравців);
+// для довільних параметрів - game_get_state_ex
 typedef struct {
     int current_player;
     int num_players;
@@ -28,18 +39,74 @@ typedef struct {
     int table_card_count[4];    // Кількість карт на столі для кожної масті
 } GameState;
 
+#define GAME_STATE_EX_VERSION 1
+
+// Стан гри будь-якого розміру: масиви виділяє викликач.
+// Ряд r на столі належить масті r / num_decks; row_low[r] = 0 - ряд не почато
+typedef struct {
+    int version;             // GAME_STATE_EX_VERSION
+    int current_player;
+    int num_players;         // Заповнює бібліотека
+    int num_rows;            // Заповнює бібліотека: 4 * num_decks
+    int player_capacity;     // Розмір player_cards_count
+    int* player_cards_count;
+    int row_capacity;        // Розмір row_low та row_high
+    int* row_low;
+    int* row_high;
+} GameStateEx;
+
+// Типи подій гри
+enum {
+    EVENT_CARD_PLAYED = 1,  // player зіграв card
+    EVENT_PASS = 2,         // player пропустив хід
+    EVENT_TURN = 3,         // хід переходить до player
+    EVENT_GAME_OVER = 4,    // гра закінчена, player - переможець
+    EVENT_DEAL = 5          // нова роздача
+};
+
+// Подія гри (seq зростає з 1 і не скидається при новій роздачі)
+typedef struct {
+    uint64_t seq;
+    int type;
+    int player;
+    Card card;  // Лише для EVENT_CARD_PLAYED
+} Event;
+
 // Ініціалізація гри
 void* game_create(int num_players);
 
+// Ініціалізація гри з параметрами (NULL - недопустимі параметри)
+void* game_create_ex(const GameConfig* config);
+
+// Параметри гри
+void game_get_config(void* game, GameConfig* config);
+
+// Копія гри (незалежний об'єкт, який треба звільнити game_destroy)
+void* game_clone(void* game);
+
 // Роздача карт
 void game_deal_cards(void* game);
 
+// Роздача карт за seed (однакова роздача для однакового seed)
+void game_deal_cards_seeded(void* game, unsigned long long seed);
+
 // Отримання стану гри
 void game_get_state(void* game, GameState* state);
 
+// Стан гри будь-якого розміру: 1 - заповнено, 0 - замалі масиви
+// (num_players та num_rows однаково заповнюються), -1 - невідома версія
+int game_get_state_ex(void* game, GameStateEx* state);
+
+// Кількість карт гравця
+int game_get_player_card_count(void* game, int player_id);
+
 // Отримання карт гравця
 int game_get_player_cards(void* game, int player_id, Card* cards, int max_cards);
 
+// Карти гравця як бітова маска (біт suit * 9 + (rank - 6));
+// для інших колод - біт suit * рангів + (rank - min_rank), 0 для кількох колод
+unsigned long long game_get_hand_mask(void* game, int player_id);
+
 // Перевірка чи можна зіграти карту
 int game_can_play_card(void* game, int player_id, Card card);
 
@@ -58,6 +125,59 @@ int game_get_current_player(void* game);
 // Хід комп'ютера (AI)
 int game_computer_move(void* game, Card* played_card);
 
+// Доіграти гру ходами game_computer_move; повертає переможця
+int game_play_out(void* game);
+
+// Оцінка ходу поточного гравця: кількість перемог у rollouts випадкових доігруваннях
+// (карти суперників перерозподіляються випадково). -1 якщо хід неможливий
+int game_rollout_wins(void* game, Card card, int rollouts, unsigned long long seed);
+
+// Розв'язок позиції при оптимальній грі (лише 2 гравці в стандартній грі, пропуск -
+// коли немає ходів).
+// Повертає переможця (-1 якщо не підтримується), plies - кількість ходів до кінця
+int game_solve(void* game, int* plies);
+
+// Карти, яких гравець точно не має: об'єднання карт, які можна було зіграти
+// під час кожного його пропуску (пропуск вважається вимушеним)
+unsigned long long game_get_pass_exclusions(void* game, int player_id);
+
+// num_samples рівномірних розподілів прихованих карт з точки зору observer,
+// сумісних з пропусками. out_hands - num_samples * num_players масок (рука
+// observer - справжня). Повертає num_samples, 0 - сумісного розподілу немає,
+// -1 - неправильні аргументи, понад 4 гравці або гра без бітових масок
+int game_sample_hands(void* game, int observer, unsigned long long seed,
+                      int num_samples, unsigned long long* out_hands);
+
+// Канонічний порядок мастей (правила не розрізняють масті). lo/hi - межі
+// столу по мастях (0 - масті немає), masks - маски карт (руки, виключення).
+// Масті сортуються за станом столу, а при рівності - за картами в масках;
+// lo, hi та masks переставляються на місці, perm[канонічна масть] = початкова
+void game_canonicalize(int* lo, int* hi, unsigned long long* masks, int num_masks, int* perm);
+
+// Таблиця ендшпілів для 2 гравців: всі позиції, де поза столом не більше
+// 2 * max_cards карт (max_cards 1-7). Повертає 1 при успіху
+int game_tablebase_generate(const char* path, int max_cards);
+
+// Відобразити файл таблиці в пам'ять (одна таблиця на процес, спільна для всіх ігор).
+// Після завантаження game_computer_move та game_solve використовують таблицю в ендшпілі
+int game_tablebase_load(const char* path);
+
+// Звільнити завантажену таблицю
+void game_tablebase_unload(void);
+
+// K завантаженої таблиці (0 - таблиця не завантажена)
+int game_tablebase_max_cards(void);
+
+// Результат позиції з таблиці: переможець (-1 - позиції немає в таблиці
+// або гра не стандартна),
+// plies - кількість ходів до кінця при оптимальній грі
+int game_tablebase_probe(void* game, int* plies);
+
+// Нові події з номером більше since_seq (не більше max_events, від найстаршої).
+// Зберігаються останні 256 подій: якщо since_seq застарів, повертаються
+// найстаріші доступні (пропуск видно за seq). Копія гри (game_clone) подій не записує.
+int game_poll_events(void* game, uint64_t since_seq, Event* out, int max_events);
+
 // Очищення гри
 void game_destroy(void* game);
 
@@ -36,6 +36,18 @@ SUIT_NAMES = {
 }
 
 
+MASK64 = (1 << 64) - 1
+
+
+def splitmix64(state: int) -> Tuple[int, int]:
+    """Крок генератора splitmix64: повертає (новий стан, випадкове число)"""
+    state = (state + 0x9E3779B97F4A7C15) & MASK64
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return state, z ^ (z >> 31)
+
+
 class Card:
     """Клас для представлення карти"""
 
@@ -74,9 +86,22 @@ class Deck:
             for rank in range(6, 15):  # 6-10, J(11), Q(12), K(13), A(14)
                 self.cards.append(Card(rank, suit))
 
-    def shuffle(self):
-        """Перемішуємо колоду"""
-        random.shuffle(self.cards)
+    def shuffle(self, seed: Optional[int] = None):
+        """
+        Перемішуємо колоду
+
+        Якщо задано seed - детерміноване перемішування (splitmix64 +
+        Fisher-Yates), таке саме, як game_deal_cards_seeded у C++.
+        """
+        if seed is None:
+            random.shuffle(self.cards)
+            return
+
+        state = seed & MASK64
+        for i in range(len(self.cards) - 1, 0, -1):
+            state, value = splitmix64(state)
+            j = value % (i + 1)
+            self.cards[i], self.cards[j] = self.cards[j], self.cards[i]
 
     def deal_cards(self, count: int) -> List[Card]:
         """Роздаємо карти"""
@@ -220,10 +245,10 @@ class SevenGame:
         self.players.append(player)
         self.consecutive_passes.append(0)
 
-    def deal_cards(self):
-        """Роздаємо карти"""
+    def deal_cards(self, seed: Optional[int] = None):
+        """Роздаємо карти (seed - детермінована роздача)"""
         deck = Deck()
-        deck.shuffle()
+        deck.shuffle(seed)
 
         cards_per_player = 36 // len(self.players)
 
@@ -263,24 +288,13 @@ class SevenGame:
         selected_card = player.select_card(self.table, can_play_seven)
 
         if selected_card == -1:
-            self.consecutive_passes[self.current_player] += 1
-            self.current_player = (self.current_player + 1) % len(self.players)
+            self.pass_turn()
             return True
 
         card = player.play_card(selected_card)
 
         if card:
-            # Оновлюємо стіл
-            if card.suit not in self.table:
-                # Нова масть на столі (має бути сімка)
-                self.table[card.suit] = (card.rank, card.rank)
-            else:
-                # Розширюємо діапазон для існуючої масті
-                min_rank, max_rank = self.table[card.suit]
-                new_min = min(min_rank, card.rank)
-                new_max = max(max_rank, card.rank)
-                self.table[card.suit] = (new_min, new_max)
-
+            self.place_card(card)
             self.consecutive_passes[self.current_player] = 0
 
             print(f"{player.name} зіграв карту: {card}")
@@ -290,13 +304,39 @@ class SevenGame:
                 print(f"\n🎉 {player.name} ВИГРАВ! 🎉")
                 return False
 
-        self.current_player = (self.current_player + 1) % len(self.players)
+        self.next_player()
         return True
 
+    def place_card(self, card: Card):
+        """Кладемо карту на стіл"""
+        if card.suit not in self.table:
+            # Нова масть на столі (має бути сімка)
+            self.table[card.suit] = (card.rank, card.rank)
+        else:
+            # Розширюємо діапазон для існуючої масті
+            min_rank, max_rank = self.table[card.suit]
+            new_min = min(min_rank, card.rank)
+            new_max = max(max_rank, card.rank)
+            self.table[card.suit] = (new_min, new_max)
+
+    def pass_turn(self):
+        """Поточний гравець пропускає хід"""
+        self.consecutive_passes[self.current_player] += 1
+        self.next_player()
+
+    def next_player(self):
+        """Передаємо хід наступному гравцю"""
+        self.current_player = (self.current_player + 1) % len(self.players)
+
     def all_players_passed(self) -> bool:
         """Перевірка чи всі гравці пропустили хід"""
         return all(passes > 0 for passes in self.consecutive_passes)
 
+    def get_winners(self) -> List[Player]:
+        """Гравці з найменшою кількістю карт (переможці, якщо всі пропустили хід)"""
+        min_cards = min(p.get_card_count() for p in self.players)
+        return [p for p in self.players if p.get_card_count() == min_cards]
+
     def play(self):
         """Головний ігровий цикл"""
         print("\n🎴 === ГРА 'СІМ' РОЗПОЧАЛАСЯ! === 🎴\n")
@@ -311,8 +351,8 @@ class SevenGame:
                 print("\nВсі гравці пропустили хід. Гра закінчена!")
 
                 # Знаходимо гравця з найменшою кількістю карт
-                min_cards = min(p.get_card_count() for p in self.players)
-                winners = [p for p in self.players if p.get_card_count() == min_cards]
+                winners = self.get_winners()
+                min_cards = winners[0].get_card_count()
 
                 if len(winners) == 1:
                     print(f"\n🏆 Переможець: {winners[0].name} (залишилось {min_cards} карт) 🏆")
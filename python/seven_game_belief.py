@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Приховані руки суперників: виключення за пропусками та рівномірна вибірка
+
+Пропуск ходу доводить, що гравець не має жодної карти, яку тоді можна
+було зіграти. Рушій накопичує ці карти як бітову маску виключень
+кожного гравця (get_pass_exclusions), а HandSampler вибирає розподіли
+прихованих карт, сумісні з виключеннями та кількістю карт у руках.
+
+Алгоритм такий самий, як HandSampler у seven_game_lib.cpp: карти
+групуються за множиною суперників, які можуть їх мати, кількість
+сумісних розподілів рахується динамікою по групах, тож вибірка
+рівномірна і не потребує відкидання.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import random
+from math import factorial
+from typing import Dict, List, Sequence, Tuple
+
+# Всі 36 карт колоди як бітова маска (біт suit * 9 + (rank - 6))
+FULL_DECK = (1 << 36) - 1
+
+
+def card_bit(rank: int, suit: int) -> int:
+    """Біт карти в масці"""
+    return 1 << (suit * 9 + rank - 6)
+
+
+def playable_mask(table: Dict[int, Tuple[int, int]]) -> int:
+    """Карти, які можна зіграти на стіл table (масть -> (min, max)), незалежно від руки"""
+    mask = 0
+    for suit in range(4):
+        if suit not in table:
+            mask |= card_bit(7, suit)
+            continue
+        low, high = table[suit]
+        if low > 6:
+            mask |= card_bit(low - 1, suit)
+        if high < 14:
+            mask |= card_bit(high + 1, suit)
+    return mask
+
+
+def table_mask(table: Dict[int, Tuple[int, int]]) -> int:
+    """Карти на столі"""
+    mask = 0
+    for suit, (low, high) in table.items():
+        for rank in range(low, high + 1):
+            mask |= card_bit(rank, suit)
+    return mask
+
+
+class HandSampler:
+    """
+    Рівномірна вибірка рук суперників
+
+    Args:
+        hidden: Маска прихованих карт (не на столі і не в руці спостерігача)
+        counts: Кількість карт кожного суперника
+        exclusions: Маска виключень кожного суперника
+    """
+
+    def __init__(self, hidden: int, counts: Sequence[int], exclusions: Sequence[int]):
+        self.counts = list(counts)
+        self.strides = []
+        states = 1
+        for count in self.counts:
+            self.strides.append(states)
+            states *= count + 1
+        self.full_state = sum(c * s for c, s in zip(self.counts, self.strides))
+
+        self.groups: List[List[int]] = []
+        self.splits: List[List[Tuple[Tuple[int, ...], int, int]]] = []
+        self.memo: Dict[Tuple[int, int], int] = {}
+        self.consistent = False
+
+        if sum(self.counts) != bin(hidden).count("1"):
+            return
+
+        # Групи карт за множиною суперників, які можуть їх мати
+        group_of_set: Dict[int, int] = {}
+        sets = []
+        for card in range(36):
+            if not hidden >> card & 1:
+                continue
+            allowed = sum(1 << i for i, excl in enumerate(exclusions) if not excl >> card & 1)
+            if not allowed:
+                return  # Карту не може мати жоден суперник
+            if allowed not in group_of_set:
+                group_of_set[allowed] = len(self.groups)
+                self.groups.append([])
+                sets.append(allowed)
+            self.groups[group_of_set[allowed]].append(card)
+
+        self.splits = [self._group_splits(len(cards), allowed)
+                       for cards, allowed in zip(self.groups, sets)]
+        self.consistent = self.ways(0, self.full_state) > 0
+
+    def _group_splits(self, n: int, allowed: int) -> List[Tuple[Tuple[int, ...], int, int]]:
+        """Всі розподіли n карт групи: (кількості, зміщення стану, кількість способів)"""
+        result = []
+
+        def build(i: int, left: int, ks: List[int]):
+            if i == len(self.counts):
+                if left == 0:
+                    weight = factorial(n)
+                    for k in ks:
+                        weight //= factorial(k)
+                    index = sum(k * s for k, s in zip(ks, self.strides))
+                    result.append((tuple(ks), index, weight))
+                return
+            top = min(left, self.counts[i]) if allowed >> i & 1 else 0
+            for k in range(top + 1):
+                build(i + 1, left - k, ks + [k])
+
+        build(0, n, [])
+        return result
+
+    def _fits(self, ks: Tuple[int, ...], state: int) -> bool:
+        return all((state // s) % (c + 1) >= k for k, s, c in zip(ks, self.strides, self.counts))
+
+    def ways(self, g: int, state: int) -> int:
+        """Кількість розподілів груп g.. , що заповнюють вільні місця state"""
+        if g == len(self.groups):
+            return 1 if state == 0 else 0
+
+        key = (g, state)
+        if key not in self.memo:
+            self.memo[key] = sum(weight * self.ways(g + 1, state - index)
+                                 for ks, index, weight in self.splits[g] if self._fits(ks, state))
+        return self.memo[key]
+
+    def sample(self, rng: random.Random) -> List[int]:
+        """Один рівномірний розподіл: маска карт кожного суперника"""
+        hands = [0] * len(self.counts)
+        state = self.full_state
+
+        for g, cards in enumerate(self.groups):
+            r = rng.randrange(self.ways(g, state))
+            for ks, index, weight in self.splits[g]:
+                if not self._fits(ks, state):
+                    continue
+                w = weight * self.ways(g + 1, state - index)
+                if r < w:
+                    break
+                r -= w
+
+            shuffled = rng.sample(cards, len(cards))
+            pos = 0
+            for i, k in enumerate(ks):
+                for card in shuffled[pos:pos + k]:
+                    hands[i] |= 1 << card
+                pos += k
+            state -= index
+
+        return hands
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Аналіз простору роздач для гри "Сім" (2 гравці)
+
+Для кожної роздачі за seed (та сама роздача, що й deal_cards_seeded)
+визначає, чи має перший гравець виграшну стратегію, і скільки ходів
+триває гра при оптимальній грі обох сторін. Роздачі обробляються
+частинами у пулі процесів; кожна готова частина зберігається окремо
+(у назві файлу - перший seed і кількість роздач), тому перерваний запуск
+продовжується з місця зупинки, а запуск з іншими параметрами в тій самій
+директорії не підхоплює чужі частини.
+
+Результат - колонковий файл .npz (seed, winner, plies).
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from typing import List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import NativeSevenGameEngine as SevenGameEngine
+
+# Частина роздач: перший seed та кількість роздач
+CHUNK_PATTERN = "chunk_{:012d}_{:08d}.npz"
+
+
+def chunk_path(out_dir: str, seed_start: int, count: int) -> str:
+    """Файл частини з роздачами seed_start .. seed_start + count - 1"""
+    return os.path.join(out_dir, CHUNK_PATTERN.format(seed_start, count))
+
+
+def analyze_chunk(task: Tuple[int, int, str]) -> int:
+    """
+    Розв'язати частину роздач і зберегти її у файл
+
+    Args:
+        task: (перший seed, кількість роздач, директорія)
+    """
+    seed_start, count, out_dir = task
+
+    engine = SevenGameEngine(2)
+    seeds = np.arange(seed_start, seed_start + count, dtype=np.uint64)
+    winners = np.empty(count, dtype=np.int8)
+    plies = np.empty(count, dtype=np.int16)
+
+    for i in range(count):
+        engine.deal_cards_seeded(int(seeds[i]))
+        winners[i], plies[i] = engine.solve()
+
+    # Запис через тимчасовий файл, щоб не лишити пошкоджену частину
+    path = chunk_path(out_dir, seed_start, count)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, seed=seeds, winner=winners, plies=plies)
+    os.replace(tmp_path, path)
+    return count
+
+
+def merge_chunks(chunks: List[str], output: str) -> dict:
+    """Об'єднати частини (у заданому порядку) в один колонковий файл"""
+    columns = {"seed": [], "winner": [], "plies": []}
+
+    for path in chunks:
+        with np.load(path) as data:
+            for name in columns:
+                columns[name].append(data[name])
+
+    merged = {name: np.concatenate(parts) for name, parts in columns.items()}
+    np.savez(output, **merged)
+    return merged
+
+
+def analyze_deals(num_deals: int, seed: int = 0, jobs: int = 0,
+                  chunk_size: int = 10000, work_dir: str = "deals_work",
+                  output: str = "deals.npz", progress=None) -> dict:
+    """
+    Розв'язати num_deals роздач у пулі процесів
+
+    Вже готові частини цього діапазону seed у work_dir пропускаються
+    (продовження роботи); в результат потрапляють лише вони, а не всі
+    файли директорії.
+    """
+    os.makedirs(work_dir, exist_ok=True)
+
+    chunks, tasks = [], []
+    for start in range(0, num_deals, chunk_size):
+        count = min(chunk_size, num_deals - start)
+        path = chunk_path(work_dir, seed + start, count)
+        chunks.append(path)
+        if not os.path.exists(path):
+            tasks.append((seed + start, count, work_dir))
+
+    done = num_deals - sum(task[1] for task in tasks)
+
+    if tasks:
+        with multiprocessing.Pool(jobs or None) as pool:
+            for count in pool.imap_unordered(analyze_chunk, tasks):
+                done += count
+                if progress is not None:
+                    progress(done, num_deals)
+
+    return merge_chunks(chunks, output)
+
+
+def main():
+    """Запуск аналізу з командного рядка"""
+    parser = argparse.ArgumentParser(description="Розв'язок роздач гри 'Сім' для 2 гравців")
+    parser.add_argument("--deals", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=0, help="кількість процесів (0 - всі ядра)")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--work-dir", default="deals_work")
+    parser.add_argument("--output", default="deals.npz")
+    args = parser.parse_args()
+
+    def progress(done, total):
+        print(f"  розв'язано роздач: {done} з {total}")
+
+    result = analyze_deals(args.deals, seed=args.seed, jobs=args.jobs,
+                           chunk_size=args.chunk_size, work_dir=args.work_dir,
+                           output=args.output, progress=progress)
+
+    winners = result["winner"]
+    print(f"\nРоздач: {len(winners)}")
+    print(f"Перший гравець має виграшну стратегію: {np.mean(winners == 0):.2%}")
+    print(f"Середня тривалість гри: {np.mean(result['plies']):.2f} ходів")
+    print(f"Результат збережено: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
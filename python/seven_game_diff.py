@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Диференційне тестування: Python-правила (seven_game.py) проти C++ рушія
+
+Обидва рушії отримують однакові роздачі (за seed) та однакові
+послідовності ходів. Після кожного ходу порівнюються руки, стіл,
+поточний гравець і результат гри. Сценарії містять і неможливі ходи
+(карти поза можливими ходами C++), тож перевіряється, що обидва рушії
+відхиляють ті самі ходи. Також вимірюється швидкість
+(ходів за секунду) кожного рушія на тих самих сценаріях.
+
+Відома відмінність: якщо всі гравці пропустили хід і кількість карт
+однакова, SevenGame.play оголошує нічию, а checkWinner у C++ повертає
+гравця з меншим номером. Такі випадки рахуються окремо як "tie".
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game import SevenGame, Player, Suit
+from seven_game_engine import NativeSevenGameEngine as SevenGameEngine, Card
+
+# Хід сценарію: (rank, suit) або None - пропуск
+Move = Optional[Tuple[int, int]]
+
+
+def illegal_moves(engine: SevenGameEngine, player: int, valid_moves: List[Card]) -> List[Tuple[int, int]]:
+    """Неможливі ходи гравця: власні карти поза можливими ходами та чужі карти"""
+    valid = {(card.rank, card.suit) for card in valid_moves}
+    own = {(card.rank, card.suit) for card in engine.get_player_cards(player)}
+    others = [(card.rank, card.suit) for p in range(engine.num_players) if p != player
+              for card in engine.get_player_cards(p)]
+    return sorted(own - valid) + others
+
+
+def make_script(engine: SevenGameEngine, seed: int, pass_prob: float,
+                illegal_prob: float = 0.0) -> List[Move]:
+    """
+    Згенерувати сценарій гри: випадкові можливі ходи з C++ рушія,
+    з імовірністю pass_prob - добровільний пропуск ходу, з імовірністю
+    illegal_prob - спроба неможливого ходу (C++ її відхиляє, хід не переходить)
+    """
+    rng = random.Random(seed)
+    engine.deal_cards_seeded(seed)
+    script: List[Move] = []
+
+    while engine.check_winner() == -1:
+        player = engine.get_current_player()
+        valid_moves = engine.get_valid_moves(player)
+
+        if rng.random() < illegal_prob:
+            candidates = illegal_moves(engine, player, valid_moves)
+            if candidates:
+                move = rng.choice(candidates)
+                engine.play_card(player, Card(*move))
+                script.append(move)
+                continue
+
+        if not valid_moves or rng.random() < pass_prob:
+            engine.pass_turn()
+            script.append(None)
+        else:
+            card = rng.choice(valid_moves)
+            engine.play_card(player, card)
+            script.append((card.rank, card.suit))
+
+    return script
+
+
+class PythonRules:
+    """Виконання сценарію на правилах SevenGame без консольного виводу"""
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+
+    def deal(self, seed: int):
+        self.game = SevenGame()
+        for i in range(self.num_players):
+            self.game.add_player(Player(f"Гравець {i + 1}"))
+        self.game.deal_cards(seed)
+        self.finished_by_cards = False
+
+    def apply(self, move: Move) -> bool:
+        """Виконати хід; False - хід неможливий за правилами Python"""
+        game = self.game
+        if move is None:
+            game.pass_turn()
+            return True
+
+        player = game.players[game.current_player]
+        rank, suit = move
+        for index in player.get_valid_moves(game.table):
+            card = player.hand[index]
+            if card.rank == rank and card.suit.value == suit:
+                game.place_card(player.play_card(index))
+                game.consecutive_passes[game.current_player] = 0
+                if not player.has_cards():
+                    # Як у make_move: гра закінчена, хід не передається
+                    self.finished_by_cards = True
+                else:
+                    game.next_player()
+                return True
+        return False
+
+    def winners(self) -> Optional[List[int]]:
+        """Переможці за правилами SevenGame.play (None - гра триває)"""
+        game = self.game
+        if self.finished_by_cards:
+            return [game.current_player]
+        if game.all_players_passed():
+            return [game.players.index(p) for p in game.get_winners()]
+        return None
+
+    def snapshot(self) -> Tuple:
+        game = self.game
+        hands = tuple(sum(1 << (c.suit.value * 9 + c.rank - 6) for c in p.hand) for p in game.players)
+        table = tuple(game.table.get(suit, (0, 0)) for suit in Suit)
+        return hands, table, game.current_player
+
+
+def native_snapshot(engine: SevenGameEngine) -> Tuple:
+    state = engine.get_state()
+    hands = tuple(engine.get_hand_mask(p) for p in range(engine.num_players))
+    table = []
+    for suit in range(4):
+        count = state.table_card_count[suit]
+        low = state.table_state[suit][0].rank if count else 0
+        table.append((low, low + count - 1) if count else (0, 0))
+    return hands, tuple(table), state.current_player
+
+
+def compare_game(engine: SevenGameEngine, rules: PythonRules, seed: int, script: List[Move]) -> Optional[dict]:
+    """Порівняти рушії на одному сценарії; повертає опис розбіжності або None"""
+    engine.deal_cards_seeded(seed)
+    rules.deal(seed)
+
+    if native_snapshot(engine) != rules.snapshot():
+        return {"seed": seed, "step": 0, "kind": "deal"}
+
+    for step, move in enumerate(script, 1):
+        if move is None:
+            engine.pass_turn()
+            python_ok = rules.apply(None)
+        else:
+            card = Card(*move)
+            native_ok = engine.play_card(engine.get_current_player(), card)
+            python_ok = rules.apply(move)
+            if native_ok != python_ok:
+                return {"seed": seed, "step": step, "kind": "legality", "move": move}
+
+        native_winner = engine.check_winner()
+        python_winners = rules.winners()
+
+        if native_winner == -1 and python_winners is None:
+            if native_snapshot(engine) != rules.snapshot():
+                return {"seed": seed, "step": step, "kind": "state"}
+            continue
+
+        if python_winners == [native_winner]:
+            return None
+        if python_winners is not None and native_winner in python_winners:
+            # Нічия в Python, C++ обирає гравця з меншим номером
+            return {"seed": seed, "step": step, "kind": "tie",
+                    "native": native_winner, "python": python_winners}
+        return {"seed": seed, "step": step, "kind": "termination",
+                "native": native_winner, "python": python_winners}
+
+    return {"seed": seed, "step": len(script), "kind": "unfinished"}
+
+
+def measure(replay, scripts: List[Tuple[int, List[Move]]]) -> float:
+    """Ходів за секунду при повторенні сценаріїв функцією replay(seed, script)"""
+    moves = sum(len(script) for _, script in scripts)
+    start = time.perf_counter()
+    for seed, script in scripts:
+        replay(seed, script)
+    return moves / (time.perf_counter() - start)
+
+
+def run_diff(games: int, num_players: int = 2, seed: int = 0, pass_prob: float = 0.0,
+             illegal_prob: float = 0.0) -> dict:
+    """Порівняти рушії на games сценаріях і виміряти швидкість"""
+    engine = SevenGameEngine(num_players)
+    rules = PythonRules(num_players)
+
+    scripts = [(seed + i, make_script(engine, seed + i, pass_prob, illegal_prob))
+               for i in range(games)]
+
+    kinds = {}
+    examples = []
+    for game_seed, script in scripts:
+        diff = compare_game(engine, rules, game_seed, script)
+        if diff is not None:
+            kinds[diff["kind"]] = kinds.get(diff["kind"], 0) + 1
+            if len(examples) < 10:
+                examples.append(diff)
+
+    def replay_native(game_seed, script):
+        engine.deal_cards_seeded(game_seed)
+        for move in script:
+            if move is None:
+                engine.pass_turn()
+            else:
+                engine.play_card(engine.get_current_player(), Card(*move))
+            engine.check_winner()
+
+    def replay_python(game_seed, script):
+        rules.deal(game_seed)
+        for move in script:
+            rules.apply(move)
+            rules.winners()
+
+    return {
+        "games": games,
+        "players": num_players,
+        "moves": sum(len(script) for _, script in scripts),
+        "divergences": kinds,
+        "examples": examples,
+        "native_moves_per_sec": measure(replay_native, scripts),
+        "python_moves_per_sec": measure(replay_python, scripts),
+    }
+
+
+def main():
+    """Запуск порівняння з командного рядка"""
+    parser = argparse.ArgumentParser(description="Порівняння Python-правил та C++ рушія")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pass-prob", type=float, default=0.1,
+                        help="імовірність добровільного пропуску ходу у сценаріях")
+    parser.add_argument("--illegal-prob", type=float, default=0.05,
+                        help="імовірність спроби неможливого ходу у сценаріях")
+    parser.add_argument("--output", help="файл JSON для результату")
+    args = parser.parse_args()
+
+    result = run_diff(args.games, args.players, args.seed, args.pass_prob, args.illegal_prob)
+
+    print(f"Сценаріїв: {result['games']}, ходів: {result['moves']}")
+    if result["divergences"]:
+        print(f"Розбіжності: {result['divergences']}")
+        for example in result["examples"]:
+            print(f"  {example}")
+    else:
+        print("Розбіжностей не знайдено")
+    print(f"C++ рушій:    {result['native_moves_per_sec']:.0f} ходів/с")
+    print(f"Python-правила: {result['python_moves_per_sec']:.0f} ходів/с")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    # Відома відмінність "tie" не є помилкою, решта - є
+    if set(result["divergences"]) - {"tie"}:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
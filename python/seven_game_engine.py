@@ -6,138 +6,379 @@ Python wrapper для C++ бібліотеки гри "Сім"
 Цей модуль використовує C++ shared library через ctypes
 для забезпечення інтеграції між Python та C++
 
+Бібліотека компілюється автоматично один раз у кеш користувача
+(ключ - хеш вихідних файлів). Якщо це неможливо, SevenGameEngine
+працює на рушії Python (seven_game_pyengine) з тим самим API.
+
 Розробник: Сергій Щербаков
 Email: sergiyscherbakov@ukr.net
 Telegram: @s_help_2010
 """
 
 import ctypes
+import hashlib
 import os
-from typing import List, Tuple, Optional
-
-# Знаходимо шлях до бібліотеки
-LIB_PATH = os.path.join(os.path.dirname(__file__), '..', 'cpp', 'libseven_game.so')
-
-# Якщо бібліотека не знайдена в стандартному місці, шукаємо в поточній директорії
-if not os.path.exists(LIB_PATH):
-    LIB_PATH = 'libseven_game.so'
-
-
-class Card(ctypes.Structure):
-    """Структура карти"""
-    _fields_ = [
-        ("rank", ctypes.c_int),  # 6-14
-        ("suit", ctypes.c_int),  # 0-3
-    ]
-
-    def __repr__(self):
-        rank_str = {
-            11: "J", 12: "Q", 13: "K", 14: "A"
-        }.get(self.rank, str(self.rank))
-
-        suit_symbols = ["♥", "♦", "♣", "♠"]
-        suit_str = suit_symbols[self.suit] if 0 <= self.suit < 4 else "?"
-
-        return f"{rank_str}{suit_str}"
-
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Iterator, List, Tuple, Optional
+
+from seven_game_types import (Card, GameConfig, GameState, GameStateEx, Event,
+                              STANDARD_RANKS)
+from seven_game_pyengine import PySevenGameEngine
+from seven_game_symmetry import canonical_position
+
+# Вихідні файли бібліотеки та параметри компіляції (як у cpp/Makefile)
+CPP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cpp')
+LIB_SOURCES = ('seven_game_lib.cpp', 'seven_game_lib.h')
+LIB_NAME = 'libseven_game.so'
+CXXFLAGS = ['-std=c++11', '-O2', '-fPIC', '-shared']
+
+# Змінні оточення: явний шлях до бібліотеки та директорія кешу збірок
+LIB_ENV = 'SEVEN_GAME_LIB'
+CACHE_ENV = 'SEVEN_GAME_CACHE'
+# Файл таблиці ендшпілів, що завантажується разом з бібліотекою
+TABLEBASE_ENV = 'SEVEN_GAME_TABLEBASE'
+
+# Позначка невдалої компіляції поруч із місцем збірки в кеші: поки вона
+# свіжіша за BUILD_RETRY_SECONDS, імпорт не компілює бібліотеку повторно
+BUILD_FAILED_MARKER = 'build_failed.txt'
+BUILD_RETRY_SECONDS = 24 * 60 * 60
+
+
+def source_hash() -> Optional[str]:
+    """Хеш вихідних файлів бібліотеки та параметрів компіляції (None - файлів немає)"""
+    digest = hashlib.sha256(' '.join(CXXFLAGS).encode())
+    for name in LIB_SOURCES:
+        path = os.path.join(CPP_DIR, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def cache_dir() -> str:
+    """Директорія кешу збірок поточного користувача"""
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'seven_game')
+
+
+def build_library(target: str) -> bool:
+    """
+    Скомпілювати бібліотеку у target
+
+    Компіляція йде у тимчасовий файл, який потім атомарно
+    перейменовується, тож паралельні процеси не бачать недописаний файл.
+    Після невдачі поруч записується позначка з виводом компілятора, і до
+    BUILD_RETRY_SECONDS наступні виклики не компілюють повторно.
+    """
+    directory = os.path.dirname(target)
+    marker = os.path.join(directory, BUILD_FAILED_MARKER)
+    try:
+        if time.time() - os.path.getmtime(marker) < BUILD_RETRY_SECONDS:
+            return False
+    except OSError:
+        pass  # Позначки немає
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix='.so', dir=directory)
+        os.close(fd)
+    except OSError:
+        return False
+
+    command = [os.environ.get('CXX', 'g++')] + CXXFLAGS + [
+        '-o', tmp_path, os.path.join(CPP_DIR, 'seven_game_lib.cpp')]
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        os.replace(tmp_path, target)
+        if os.path.exists(marker):
+            os.remove(marker)
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            with open(marker, 'w', encoding='utf-8') as f:
+                f.write(e.stderr.decode(errors='replace') if getattr(e, 'stderr', None) else str(e))
+        except OSError:
+            pass
+        return False
+
+
+def library_candidates() -> Iterator[Tuple[str, bool]]:
+    """
+    Шляхи до C++ бібліотеки в порядку пріоритету, за потреби з компіляцією
+
+    Порядок пошуку:
+        1. Шлях зі змінної SEVEN_GAME_LIB
+        2. Збірка в кеші за хешем вихідних файлів (компілюється, якщо її немає)
+        3. cpp/libseven_game.so, якщо вона новіша за вихідні файли
+           або вихідних файлів немає
+
+    Yields:
+        (шлях, чи це збірка з кешу)
+    """
+    if os.environ.get(LIB_ENV):
+        yield os.environ[LIB_ENV], False
+
+    digest = source_hash()
+    if digest is not None:
+        cached = os.path.join(cache_dir(), digest, LIB_NAME)
+        if os.path.exists(cached) or build_library(cached):
+            yield cached, True
+
+    prebuilt = os.path.join(CPP_DIR, LIB_NAME)
+    if os.path.exists(prebuilt):
+        sources = [os.path.join(CPP_DIR, name) for name in LIB_SOURCES]
+        newest_source = max((os.path.getmtime(p) for p in sources if os.path.exists(p)), default=0)
+        if os.path.getmtime(prebuilt) >= newest_source:
+            yield prebuilt, False
+
+
+def find_library() -> Optional[str]:
+    """Перший знайдений шлях до C++ бібліотеки (без перевірки завантаження)"""
+    return next((path for path, _ in library_candidates()), None)
+
+
+def _setup_function_types(lib):
+    """Налаштування типів для функцій C API"""
+    # game_create
+    lib.game_create.argtypes = [ctypes.c_int]
+    lib.game_create.restype = ctypes.c_void_p
+
+    # game_create_ex
+    lib.game_create_ex.argtypes = [ctypes.POINTER(GameConfig)]
+    lib.game_create_ex.restype = ctypes.c_void_p
+
+    # game_get_config
+    lib.game_get_config.argtypes = [ctypes.c_void_p, ctypes.POINTER(GameConfig)]
+    lib.game_get_config.restype = None
+
+    # game_clone
+    lib.game_clone.argtypes = [ctypes.c_void_p]
+    lib.game_clone.restype = ctypes.c_void_p
+
+    # game_deal_cards
+    lib.game_deal_cards.argtypes = [ctypes.c_void_p]
+    lib.game_deal_cards.restype = None
+
+    # game_deal_cards_seeded
+    lib.game_deal_cards_seeded.argtypes = [ctypes.c_void_p, ctypes.c_ulonglong]
+    lib.game_deal_cards_seeded.restype = None
+
+    # game_get_state
+    lib.game_get_state.argtypes = [ctypes.c_void_p, ctypes.POINTER(GameState)]
+    lib.game_get_state.restype = None
+
+    # game_get_state_ex
+    lib.game_get_state_ex.argtypes = [ctypes.c_void_p, ctypes.POINTER(GameStateEx)]
+    lib.game_get_state_ex.restype = ctypes.c_int
+
+    # game_get_player_card_count
+    lib.game_get_player_card_count.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    lib.game_get_player_card_count.restype = ctypes.c_int
+
+    # game_get_player_cards
+    lib.game_get_player_cards.argtypes = [ctypes.c_void_p, ctypes.c_int,
+                                          ctypes.POINTER(Card), ctypes.c_int]
+    lib.game_get_player_cards.restype = ctypes.c_int
+
+    # game_get_hand_mask
+    lib.game_get_hand_mask.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    lib.game_get_hand_mask.restype = ctypes.c_ulonglong
+
+    # game_can_play_card
+    lib.game_can_play_card.argtypes = [ctypes.c_void_p, ctypes.c_int, Card]
+    lib.game_can_play_card.restype = ctypes.c_int
+
+    # game_play_card
+    lib.game_play_card.argtypes = [ctypes.c_void_p, ctypes.c_int, Card]
+    lib.game_play_card.restype = ctypes.c_int
+
+    # game_pass_turn
+    lib.game_pass_turn.argtypes = [ctypes.c_void_p]
+    lib.game_pass_turn.restype = None
+
+    # game_check_winner
+    lib.game_check_winner.argtypes = [ctypes.c_void_p]
+    lib.game_check_winner.restype = ctypes.c_int
+
+    # game_get_current_player
+    lib.game_get_current_player.argtypes = [ctypes.c_void_p]
+    lib.game_get_current_player.restype = ctypes.c_int
+
+    # game_computer_move
+    lib.game_computer_move.argtypes = [ctypes.c_void_p, ctypes.POINTER(Card)]
+    lib.game_computer_move.restype = ctypes.c_int
+
+    # game_play_out
+    lib.game_play_out.argtypes = [ctypes.c_void_p]
+    lib.game_play_out.restype = ctypes.c_int
+
+    # game_rollout_wins
+    lib.game_rollout_wins.argtypes = [ctypes.c_void_p, Card, ctypes.c_int, ctypes.c_ulonglong]
+    lib.game_rollout_wins.restype = ctypes.c_int
+
+    # game_solve
+    lib.game_solve.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+    lib.game_solve.restype = ctypes.c_int
+
+    # game_get_pass_exclusions
+    lib.game_get_pass_exclusions.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    lib.game_get_pass_exclusions.restype = ctypes.c_ulonglong
+
+    # game_sample_hands
+    lib.game_sample_hands.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_ulonglong,
+                                      ctypes.c_int, ctypes.POINTER(ctypes.c_ulonglong)]
+    lib.game_sample_hands.restype = ctypes.c_int
+
+    # game_canonicalize
+    lib.game_canonicalize.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                      ctypes.POINTER(ctypes.c_ulonglong), ctypes.c_int,
+                                      ctypes.POINTER(ctypes.c_int)]
+    lib.game_canonicalize.restype = None
+
+    # game_tablebase_generate
+    lib.game_tablebase_generate.argtypes = [ctypes.c_char_p, ctypes.c_int]
+    lib.game_tablebase_generate.restype = ctypes.c_int
+
+    # game_tablebase_load
+    lib.game_tablebase_load.argtypes = [ctypes.c_char_p]
+    lib.game_tablebase_load.restype = ctypes.c_int
+
+    # game_tablebase_unload
+    lib.game_tablebase_unload.argtypes = []
+    lib.game_tablebase_unload.restype = None
+
+    # game_tablebase_max_cards
+    lib.game_tablebase_max_cards.argtypes = []
+    lib.game_tablebase_max_cards.restype = ctypes.c_int
+
+    # game_tablebase_probe
+    lib.game_tablebase_probe.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+    lib.game_tablebase_probe.restype = ctypes.c_int
+
+    # game_poll_events
+    lib.game_poll_events.argtypes = [ctypes.c_void_p, ctypes.c_uint64,
+                                     ctypes.POINTER(Event), ctypes.c_int]
+    lib.game_poll_events.restype = ctypes.c_int
+
+    # game_destroy
+    lib.game_destroy.argtypes = [ctypes.c_void_p]
+    lib.game_destroy.restype = None
+
+
+def load_library() -> Optional[ctypes.CDLL]:
+    """
+    Завантажити бібліотеку та налаштувати типи функцій (None - недоступна)
+
+    Якщо кандидат не завантажується, пробується наступний; пошкоджена
+    збірка в кеші видаляється, щоб наступний імпорт скомпілював її заново.
+    """
+    lib = None
+    for path, cached in library_candidates():
+        try:
+            lib = ctypes.CDLL(path)
+            _setup_function_types(lib)
+            break
+        except (OSError, AttributeError) as e:
+            # Пошкоджена або застаріла бібліотека (немає потрібних функцій)
+            print(f"Не вдалося завантажити {path}: {e}", file=sys.stderr)
+            lib = None
+            if cached:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    if lib is None:
+        return None
 
-class GameState(ctypes.Structure):
-    """Структура стану гри"""
-    _fields_ = [
-        ("current_player", ctypes.c_int),
-        ("num_players", ctypes.c_int),
-        ("player_cards_count", ctypes.c_int * 4),
-        ("table_state", (Card * 9) * 4),
-        ("table_card_count", ctypes.c_int * 4),
-    ]
+    tablebase = os.environ.get(TABLEBASE_ENV)
+    if tablebase and not lib.game_tablebase_load(os.fsencode(tablebase)):
+        print(f"Не вдалося завантажити таблицю ендшпілів {tablebase}", file=sys.stderr)
+    return lib
 
 
-class SevenGameEngine:
+class NativeSevenGameEngine:
     """Python wrapper для C++ движка гри"""
 
     SUIT_NAMES = ["Черви", "Буби", "Хрести", "Піки"]
     SUIT_SYMBOLS = ["♥", "♦", "♣", "♠"]
 
-    def __init__(self, num_players: int = 2):
+    def __init__(self, num_players: int = 2, min_rank: int = STANDARD_RANKS[0],
+                 max_rank: int = STANDARD_RANKS[1], num_decks: int = 1):
         """
         Ініціалізація гри
 
         Args:
-            num_players: Кількість гравців (2-4)
+            num_players: Кількість гравців (2-8)
+            min_rank, max_rank: Ранги колоди (стандартно 6-14, 2-14 - 52 карти)
+            num_decks: Кількість колод (1-4)
         """
-        # Завантажуємо бібліотеку
-        self.lib = ctypes.CDLL(LIB_PATH)
-
-        # Налаштовуємо типи функцій
-        self._setup_function_types()
+        if _LIB is None:
+            raise OSError("C++ бібліотека гри недоступна")
+        self.lib = _LIB
 
         # Створюємо гру
-        self.game = self.lib.game_create(num_players)
+        config = GameConfig(num_players, min_rank, max_rank, num_decks)
+        self.game = self.lib.game_create_ex(ctypes.byref(config))
+        if not self.game:
+            raise ValueError(f"Недопустимі параметри гри: гравців {num_players}, "
+                             f"ранги {min_rank}-{max_rank}, колод {num_decks}")
         self.num_players = num_players
-
-    def _setup_function_types(self):
-        """Налаштування типів для функцій C API"""
-        # game_create
-        self.lib.game_create.argtypes = [ctypes.c_int]
-        self.lib.game_create.restype = ctypes.c_void_p
-
-        # game_deal_cards
-        self.lib.game_deal_cards.argtypes = [ctypes.c_void_p]
-        self.lib.game_deal_cards.restype = None
-
-        # game_get_state
-        self.lib.game_get_state.argtypes = [ctypes.c_void_p, ctypes.POINTER(GameState)]
-        self.lib.game_get_state.restype = None
-
-        # game_get_player_cards
-        self.lib.game_get_player_cards.argtypes = [ctypes.c_void_p, ctypes.c_int,
-                                                     ctypes.POINTER(Card), ctypes.c_int]
-        self.lib.game_get_player_cards.restype = ctypes.c_int
-
-        # game_can_play_card
-        self.lib.game_can_play_card.argtypes = [ctypes.c_void_p, ctypes.c_int, Card]
-        self.lib.game_can_play_card.restype = ctypes.c_int
-
-        # game_play_card
-        self.lib.game_play_card.argtypes = [ctypes.c_void_p, ctypes.c_int, Card]
-        self.lib.game_play_card.restype = ctypes.c_int
-
-        # game_pass_turn
-        self.lib.game_pass_turn.argtypes = [ctypes.c_void_p]
-        self.lib.game_pass_turn.restype = None
-
-        # game_check_winner
-        self.lib.game_check_winner.argtypes = [ctypes.c_void_p]
-        self.lib.game_check_winner.restype = ctypes.c_int
-
-        # game_get_current_player
-        self.lib.game_get_current_player.argtypes = [ctypes.c_void_p]
-        self.lib.game_get_current_player.restype = ctypes.c_int
-
-        # game_computer_move
-        self.lib.game_computer_move.argtypes = [ctypes.c_void_p, ctypes.POINTER(Card)]
-        self.lib.game_computer_move.restype = ctypes.c_int
-
-        # game_destroy
-        self.lib.game_destroy.argtypes = [ctypes.c_void_p]
-        self.lib.game_destroy.restype = None
+        self.min_rank, self.max_rank, self.num_decks = min_rank, max_rank, num_decks
+        self._event_buffer = (Event * 64)()
+
+    def clone(self) -> "NativeSevenGameEngine":
+        """Незалежна копія гри (наприклад, для аналізу в іншому потоці)"""
+        copy = object.__new__(NativeSevenGameEngine)
+        copy.lib = self.lib
+        copy.num_players = self.num_players
+        copy.min_rank, copy.max_rank, copy.num_decks = self.min_rank, self.max_rank, self.num_decks
+        copy.game = self.lib.game_clone(self.game)
+        copy._event_buffer = (Event * 64)()
+        return copy
 
     def deal_cards(self):
         """Роздати карти"""
         self.lib.game_deal_cards(self.game)
 
+    def deal_cards_seeded(self, seed: int):
+        """Роздати карти за seed (однаковий seed - однакова роздача)"""
+        self.lib.game_deal_cards_seeded(self.game, seed)
+
     def get_state(self) -> GameState:
-        """Отримати стан гри"""
+        """Отримати стан гри (до 4 гравців і 9 карт у масті; повний стан - get_state_ex)"""
         state = GameState()
         self.lib.game_get_state(self.game, ctypes.byref(state))
         return state
 
+    def get_state_ex(self) -> GameStateEx:
+        """Отримати стан гри будь-якого розміру"""
+        state = GameStateEx.allocate(self.num_players, 4 * self.num_decks)
+        if self.lib.game_get_state_ex(self.game, ctypes.byref(state)) != 1:
+            raise RuntimeError("Бібліотека не підтримує цю версію GameStateEx")
+        return state
+
     def get_player_cards(self, player_id: int) -> List[Card]:
         """Отримати карти гравця"""
-        cards = (Card * 20)()  # Максимум 20 карт
-        count = self.lib.game_get_player_cards(self.game, player_id, cards, 20)
+        count = self.lib.game_get_player_card_count(self.game, player_id)
+        cards = (Card * count)()
+        count = self.lib.game_get_player_cards(self.game, player_id, cards, count)
         return [cards[i] for i in range(count)]
 
+    def get_hand_mask(self, player_id: int) -> int:
+        """
+        Карти гравця як бітова маска (біт suit * 9 + (rank - 6)); для інших
+        колод - біт suit * рангів + (rank - min_rank), 0 для кількох колод
+        """
+        return self.lib.game_get_hand_mask(self.game, player_id)
+
     def can_play_card(self, player_id: int, card: Card) -> bool:
         """Перевірити чи можна зіграти карту"""
         return bool(self.lib.game_can_play_card(self.game, player_id, card))
@@ -165,21 +406,174 @@ class SevenGameEngine:
             return card
         return None
 
+    def play_out(self) -> int:
+        """Доіграти гру ходами комп'ютера; повертає переможця"""
+        return self.lib.game_play_out(self.game)
+
+    def hand_strength(self, player_id: int) -> float:
+        """Оцінка імовірності перемоги за роздачею (seven_game_strength)"""
+        from seven_game_strength import engine_hand_strength
+        return engine_hand_strength(self, player_id)
+
     def get_valid_moves(self, player_id: int) -> List[Card]:
         """Отримати список можливих ходів для гравця"""
         cards = self.get_player_cards(player_id)
         return [card for card in cards if self.can_play_card(player_id, card)]
 
+    def rollout_wins(self, card: Card, rollouts: int, seed: int = 0) -> int:
+        """
+        Оцінити хід поточного гравця випадковими доігруваннями
+
+        Returns:
+            Кількість перемог з rollouts (-1 якщо хід неможливий)
+        """
+        return self.lib.game_rollout_wins(self.game, card, rollouts, seed)
+
+    def get_pass_exclusions(self, player_id: int) -> int:
+        """Карти, яких гравець точно не має (за його пропусками), як бітова маска"""
+        return self.lib.game_get_pass_exclusions(self.game, player_id)
+
+    def sample_hands(self, observer: int, count: int, seed: int = 0) -> List[Tuple[int, ...]]:
+        """
+        Рівномірні розподіли прихованих карт з точки зору observer,
+        сумісні з пропусками суперників (для AI з пошуком по вибірках)
+
+        Returns:
+            count кортежів масок рук усіх гравців (рука observer - справжня);
+            порожній список, якщо сумісного розподілу немає
+        """
+        hands = (ctypes.c_ulonglong * (count * self.num_players))()
+        if self.lib.game_sample_hands(self.game, observer, seed, count, hands) <= 0:
+            return []
+        n = self.num_players
+        return [tuple(hands[i * n:(i + 1) * n]) for i in range(count)]
+
+    def canonical_position(self, observer: int) -> Tuple[tuple, List[int]]:
+        """
+        Ключ позиції з точки зору observer, однаковий для всіх перестановок
+        мастей (для кешів), та perm[канонічна масть] = початкова масть
+        """
+        return canonical_position(self, observer, native_canonicalize)
+
+    def poll_events(self, since_seq: int = 0) -> List[Event]:
+        """Нові події з номером більше since_seq (не більше 64 за виклик)"""
+        buffer = self._event_buffer
+        count = self.lib.game_poll_events(self.game, since_seq, buffer, len(buffer))
+        return [Event.from_buffer_copy(buffer[i]) for i in range(count)]
+
+    def events(self, since_seq: int = 0) -> Iterator[Event]:
+        """Ітератор по всіх нових подіях з номером більше since_seq"""
+        while True:
+            batch = self.poll_events(since_seq)
+            if not batch:
+                return
+            yield from batch
+            since_seq = batch[-1].seq
+
+    def solve(self) -> Tuple[int, int]:
+        """
+        Розв'язати позицію при оптимальній грі обох гравців (лише 2 гравці,
+        стандартна колода)
+
+        Returns:
+            (переможець, кількість ходів до кінця гри); переможець -1,
+            якщо гра не підтримується
+        """
+        plies = ctypes.c_int()
+        winner = self.lib.game_solve(self.game, ctypes.byref(plies))
+        return winner, plies.value
+
+    def tablebase_probe(self) -> Optional[Tuple[int, int]]:
+        """
+        Результат позиції з таблиці ендшпілів (лише 2 гравці)
+
+        Returns:
+            (переможець, кількість ходів до кінця гри) або None,
+            якщо таблиця не завантажена чи позиції в ній немає
+        """
+        plies = ctypes.c_int()
+        winner = self.lib.game_tablebase_probe(self.game, ctypes.byref(plies))
+        if winner == -1:
+            return None
+        return winner, plies.value
+
     def __del__(self):
         """Очищення ресурсів"""
         if hasattr(self, 'game') and self.game:
             self.lib.game_destroy(self.game)
 
 
-# Тестування модуля
-if __name__ == "__main__":
+# Бібліотека завантажується (і за потреби компілюється) один раз при імпорті
+_LIB = load_library()
+LIB_PATH = _LIB._name if _LIB is not None else None
+
+# SevenGameEngine - C++ рушій, якщо бібліотека доступна, інакше рушій на Python
+SevenGameEngine = NativeSevenGameEngine if _LIB is not None else PySevenGameEngine
+
+
+def native_canonicalize(lo: List[int], hi: List[int],
+                        masks: List[int]) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """Канонічний порядок мастей у C++ (як seven_game_symmetry.canonicalize)"""
+    c_lo = (ctypes.c_int * 4)(*lo)
+    c_hi = (ctypes.c_int * 4)(*hi)
+    c_masks = (ctypes.c_ulonglong * len(masks))(*masks)
+    perm = (ctypes.c_int * 4)()
+    _LIB.game_canonicalize(c_lo, c_hi, c_masks, len(masks), perm)
+    return list(c_lo), list(c_hi), list(c_masks), list(perm)
+
+
+def load_tablebase(path: str) -> bool:
+    """
+    Завантажити таблицю ендшпілів (seven_game_tablebase.py) для всіх ігор
+    C++ рушія: computer_move і solve далі використовують її в ендшпілі
+    """
+    if _LIB is None:
+        return False
+    return bool(_LIB.game_tablebase_load(os.fsencode(path)))
+
+
+def unload_tablebase():
+    """Звільнити завантажену таблицю ендшпілів"""
+    if _LIB is not None:
+        _LIB.game_tablebase_unload()
+
+
+# Доступні рушії для create_engine
+ENGINES = ("auto", "native", "python")
+
+
+def resolve_engine(engine: str = "auto") -> str:
+    """Визначити рушій: "auto" стає "native", якщо C++ бібліотека доступна"""
+    if engine not in ENGINES:
+        raise ValueError(f"Невідомий рушій: {engine} (доступні: {', '.join(ENGINES)})")
+
+    if engine == "auto":
+        return "native" if _LIB is not None else "python"
+
+    return engine
+
+
+def create_engine(num_players: int = 2, engine: str = "auto", min_rank: int = STANDARD_RANKS[0],
+                  max_rank: int = STANDARD_RANKS[1], num_decks: int = 1):
+    """
+    Створити рушій гри
+
+    Args:
+        num_players: Кількість гравців (2-4, C++ рушій - до 8)
+        engine: "native" - C++ бібліотека, "python" - рушій на Python,
+                "auto" - C++, якщо бібліотека доступна
+        min_rank, max_rank, num_decks: Колода (рушій на Python - лише стандартна)
+    """
+    if resolve_engine(engine) == "native":
+        return NativeSevenGameEngine(num_players, min_rank, max_rank, num_decks)
+    return PySevenGameEngine(num_players, min_rank, max_rank, num_decks)
+
+
+def smoke_test():
+    """Тестування модуля"""
     print("Тест Python wrapper для C++ бібліотеки")
     print("=" * 50)
+    print(f"Рушій: {resolve_engine()} ({LIB_PATH or 'без C++ бібліотеки'})")
 
     engine = SevenGameEngine(2)
     engine.deal_cards()
@@ -193,4 +587,34 @@ if __name__ == "__main__":
         print(f"\nГравець {i + 1} має {len(cards)} карт:")
         print(" ".join(str(card) for card in cards))
 
-    print("\n✓ Тест успішний! Python використовує C++ бібліотеку!")
+    if SevenGameEngine is NativeSevenGameEngine:
+        print("\n✓ Тест успішний! Python використовує C++ бібліотеку!")
+    else:
+        print("\n✓ Тест успішний! Використовується рушій на Python")
+
+
+def main(argv=None):
+    """
+    Командний рядок:
+        python -m seven_game_engine                - тест модуля
+        python -m seven_game_engine simulate ...   - симуляція ігор без участі людини
+    """
+    import argparse
+    import seven_game_simulate
+
+    parser = argparse.ArgumentParser(prog="seven_game_engine", description="Рушій гри 'Сім'")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("test", help="тест модуля")
+    seven_game_simulate.add_arguments(
+        commands.add_parser("simulate", help="симуляція ігор з виводом JSON lines"))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        seven_game_simulate.run(args)
+    else:
+        smoke_test()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Векторизоване кодування позицій гри "Сім" у тензори NumPy
+
+Позиція з точки зору гравця описується компактно:
+    hand      - бітова маска власних карт (uint64, біт suit * 9 + (rank - 6))
+    table_lo  - мінімальний ранг на столі для кожної масті (0 - масті немає)
+    table_hi  - максимальний ранг на столі для кожної масті
+    counts    - кількість карт у гравців, починаючи з самого гравця
+                (далі суперники за порядком ходу, 0 - місце не зайняте)
+
+encode_batch перетворює цілий батч таких позицій у площини
+форми (N, NUM_PLANES, 36) одним векторизованим викликом.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import SevenGameEngine, Card
+from seven_game_types import is_standard_game
+
+NUM_CARDS = 36
+MAX_PLAYERS = 4
+
+# Площини: власна рука, стіл, можливі ходи, кількість карт кожного суперника
+PLANES = ["hand", "table", "legal"] + [f"opponent_{i}" for i in range(1, MAX_PLAYERS)]
+NUM_PLANES = len(PLANES)
+
+# Ранг та масть для кожного індексу карти
+CARD_RANKS = np.tile(np.arange(6, 15, dtype=np.int8), 4)
+CARD_SUITS = np.repeat(np.arange(4, dtype=np.int8), 9)
+_BITS = np.arange(NUM_CARDS, dtype=np.uint64)
+
+
+def card_index(card: Card) -> int:
+    """Індекс карти у площині (0-35)"""
+    return card.suit * 9 + (card.rank - 6)
+
+
+def index_to_card(index: int) -> Card:
+    """Карта за індексом у площині"""
+    return Card(int(CARD_RANKS[index]), int(CARD_SUITS[index]))
+
+
+def position_from_engine(engine: SevenGameEngine, player_id: int) -> Tuple[int, List[int], List[int], List[int]]:
+    """Компактна позиція гравця: (hand, table_lo, table_hi, counts)"""
+    if not is_standard_game(engine):
+        raise ValueError("Кодування позицій - лише для стандартної гри з 2-4 гравцями")
+    state = engine.get_state()
+
+    table_lo, table_hi = [], []
+    for suit in range(4):
+        count = state.table_card_count[suit]
+        if count:
+            low = state.table_state[suit][0].rank
+            table_lo.append(low)
+            table_hi.append(low + count - 1)
+        else:
+            table_lo.append(0)
+            table_hi.append(0)
+
+    counts = [0] * MAX_PLAYERS
+    for offset in range(state.num_players):
+        counts[offset] = state.player_cards_count[(player_id + offset) % state.num_players]
+
+    return engine.get_hand_mask(player_id), table_lo, table_hi, counts
+
+
+def unpack_masks(masks: np.ndarray) -> np.ndarray:
+    """Бітові маски (N,) -> булеві площини (N, 36)"""
+    masks = np.asarray(masks, dtype=np.uint64)
+    return ((masks[:, None] >> _BITS) & np.uint64(1)).astype(bool)
+
+
+def table_planes(table_lo: np.ndarray, table_hi: np.ndarray) -> np.ndarray:
+    """Карти на столі (N, 36)"""
+    lo = np.asarray(table_lo, dtype=np.int8)[:, CARD_SUITS]
+    hi = np.asarray(table_hi, dtype=np.int8)[:, CARD_SUITS]
+    return (lo > 0) & (lo <= CARD_RANKS) & (CARD_RANKS <= hi)
+
+
+def legal_mask(hands: np.ndarray, table_lo: np.ndarray, table_hi: np.ndarray) -> np.ndarray:
+    """Маска можливих ходів (N, 36) для батчу позицій"""
+    lo = np.asarray(table_lo, dtype=np.int8)[:, CARD_SUITS]
+    hi = np.asarray(table_hi, dtype=np.int8)[:, CARD_SUITS]
+
+    playable = np.where(lo == 0,
+                        CARD_RANKS == 7,
+                        (CARD_RANKS == lo - 1) | (CARD_RANKS == hi + 1))
+    return playable & unpack_masks(hands)
+
+
+def encode_batch(hands: np.ndarray, table_lo: np.ndarray, table_hi: np.ndarray,
+                 counts: np.ndarray, dtype=np.float32, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Закодувати батч позицій у площини (N, NUM_PLANES, 36)
+
+    Args:
+        hands: (N,) бітові маски власних карт
+        table_lo, table_hi: (N, 4) межі столу по мастях
+        counts: (N, MAX_PLAYERS) кількість карт, починаючи з самого гравця
+        dtype: Тип результату (значення - 0/1 та кількість карт)
+        out: Необов'язковий масив для запису результату
+    """
+    hands = np.asarray(hands, dtype=np.uint64)
+    counts = np.asarray(counts)
+
+    if out is None:
+        out = np.empty((len(hands), NUM_PLANES, NUM_CARDS), dtype=dtype)
+
+    out[:, 0] = unpack_masks(hands)
+    out[:, 1] = table_planes(table_lo, table_hi)
+    out[:, 2] = legal_mask(hands, table_lo, table_hi)
+    out[:, 3:] = counts[:, 1:MAX_PLAYERS, None]
+    return out
+
+
+class ShardWriter:
+    """
+    Запис прикладів у файли .npy фіксованого розміру через memmap
+
+    У пам'яті одночасно тримається лише один шард, тож обсяг RAM
+    обмежений shard_size незалежно від загальної кількості прикладів.
+    Для шарду i створюються файли {prefix}_{i:05d}_planes.npy,
+    _moves.npy (індекс карти, -1 - пропуск) та _values.npy (1 - перемога).
+    """
+
+    def __init__(self, directory: str, shard_size: int = 65536, prefix: str = "selfplay"):
+        self.directory = directory
+        self.shard_size = shard_size
+        self.prefix = prefix
+        self.shard_index = 0
+        self.position = 0
+        self.total = 0
+        self.arrays = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, shard_index: int, name: str) -> str:
+        return os.path.join(self.directory, f"{self.prefix}_{shard_index:05d}_{name}.npy")
+
+    def _open_shard(self):
+        shapes = {
+            "planes": ((self.shard_size, NUM_PLANES, NUM_CARDS), np.uint8),
+            "moves": ((self.shard_size,), np.int8),
+            "values": ((self.shard_size,), np.int8),
+        }
+        self.arrays = {
+            name: np.lib.format.open_memmap(self._path(self.shard_index, name),
+                                            mode="w+", dtype=dtype, shape=shape)
+            for name, (shape, dtype) in shapes.items()
+        }
+        self.position = 0
+
+    def _close_shard(self):
+        if self.arrays is None:
+            return
+
+        arrays, self.arrays = self.arrays, None
+        for name in list(arrays):
+            array = arrays.pop(name)
+            array.flush()
+            if self.position < self.shard_size:
+                # Неповний останній шард обрізаємо до реального розміру
+                data = np.array(array[:self.position])
+                del array
+                np.save(self._path(self.shard_index, name), data)
+
+        self.shard_index += 1
+
+    def write(self, planes: np.ndarray, moves: np.ndarray, values: np.ndarray):
+        """Додати батч прикладів"""
+        start = 0
+        while start < len(planes):
+            if self.arrays is None:
+                self._open_shard()
+
+            count = min(len(planes) - start, self.shard_size - self.position)
+            end = self.position + count
+            self.arrays["planes"][self.position:end] = planes[start:start + count]
+            self.arrays["moves"][self.position:end] = moves[start:start + count]
+            self.arrays["values"][self.position:end] = values[start:start + count]
+
+            self.position = end
+            self.total += count
+            start += count
+
+            if self.position == self.shard_size:
+                self._close_shard()
+
+    def close(self):
+        """Завершити запис (обрізає останній шард)"""
+        self._close_shard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_shards(directory: str, prefix: str = "selfplay") -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Читати шарди як memmap: (planes, moves, values)"""
+    index = 0
+    while True:
+        base = os.path.join(directory, f"{prefix}_{index:05d}")
+        if not os.path.exists(base + "_planes.npy"):
+            return
+        yield (np.load(base + "_planes.npy", mmap_mode="r"),
+               np.load(base + "_moves.npy", mmap_mode="r"),
+               np.load(base + "_values.npy", mmap_mode="r"))
+        index += 1
+
+
+def generate_selfplay(writer: ShardWriter, num_games: int, num_players: int = 2,
+                      seed: int = 0, policy=None) -> int:
+    """
+    Згенерувати приклади самогри та записати їх у шарди
+
+    Позиції однієї гри збираються у невеликі буфери і кодуються одним
+    батчем, коли відомий результат гри.
+    """
+    from seven_game_policies import random_policy
+
+    policy = policy or random_policy
+    engine = SevenGameEngine(num_players)
+
+    for game in range(num_games):
+        engine.deal_cards_seeded(seed + game)
+        hands, table_lo, table_hi, counts, moves, movers = [], [], [], [], [], []
+
+        winner = engine.check_winner()
+        while winner == -1:
+            player = engine.get_current_player()
+            hand, lo, hi, count = position_from_engine(engine, player)
+            hands.append(hand)
+            table_lo.append(lo)
+            table_hi.append(hi)
+            counts.append(count)
+            movers.append(player)
+
+            card = policy(engine, player)
+            moves.append(card_index(card) if card is not None else -1)
+            winner = engine.check_winner()
+
+        planes = encode_batch(np.array(hands, dtype=np.uint64), np.array(table_lo),
+                              np.array(table_hi), np.array(counts), dtype=np.uint8)
+        values = (np.array(movers) == winner).astype(np.int8)
+        writer.write(planes, np.array(moves, dtype=np.int8), values)
+
+    return writer.total
+
+
+def main():
+    """Генерація навчальних даних з командного рядка"""
+    parser = argparse.ArgumentParser(description="Генерація прикладів самогри у шарди .npy")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=65536)
+    parser.add_argument("--output", default="selfplay_data")
+    args = parser.parse_args()
+
+    with ShardWriter(args.output, args.shard_size) as writer:
+        total = generate_selfplay(writer, args.games, args.players, args.seed)
+
+    print(f"Записано прикладів: {total} у {writer.shard_index} шард(ів): {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,9 @@ Telegram: @s_help_2010
 import tkinter as tk
 from tkinter import messagebox, ttk
 import os
+import queue
 import sys
+import threading
 
 # Додаємо шлях до модуля
 sys.path.insert(0, os.path.dirname(__file__))
@@ -19,6 +21,12 @@ sys.path.insert(0, os.path.dirname(__file__))
 from seven_game_engine import SevenGameEngine, Card
 
 
+# Підказки: доігрування за один крок, максимум на карту, період оновлення (мс)
+HINT_BATCH = 200
+HINT_MAX_ROLLOUTS = 5000
+HINT_POLL_MS = 250
+
+
 class SevenGameGUI:
     """GUI для гри Сім"""
 
@@ -37,6 +45,17 @@ class SevenGameGUI:
         self.is_ai_game = True
         self.player_names = ["Гравець 1", "Комп'ютер"]
 
+        # Підказки: кеш оцінок за позицією, фоновий потік з доігруваннями
+        self.show_hints = False
+        self.hint_cache = {}      # ключ позиції -> {канонічний індекс карти: (перемоги, доігрування)}
+        self.hint_suits = {suit: suit for suit in range(4)}  # масть -> канонічна масть
+        self.hint_key = None      # позиція, яку зараз аналізує фоновий потік
+        self.hint_labels = {}     # індекс карти -> Label з оцінкою
+        self.hint_jobs = queue.Queue()
+        self.hint_updates = queue.Queue()
+        threading.Thread(target=self.hint_worker, daemon=True).start()
+        self.root.after(HINT_POLL_MS, self.poll_hints)
+
         # Показуємо меню вибору
         self.show_menu()
 
@@ -55,6 +74,8 @@ class SevenGameGUI:
 
     def show_menu(self):
         """Показати меню вибору режиму гри"""
+        self.hint_key = None
+
         # Очищуємо вікно
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -199,6 +220,17 @@ class SevenGameGUI:
             cursor="hand2"
         ).pack(side=tk.RIGHT, padx=10)
 
+        self.hint_button = tk.Button(
+            top_panel,
+            text=self.hint_button_text(),
+            font=("Arial", 10),
+            bg="#f39c12",
+            fg="white",
+            command=self.toggle_hints,
+            cursor="hand2"
+        )
+        self.hint_button.pack(side=tk.RIGHT, padx=10)
+
         # Панель іншого гравця (зверху)
         other_player = 1 if self.engine.get_current_player() == 0 else 0
         self.create_player_panel(other_player, "top")
@@ -321,10 +353,19 @@ class SevenGameGUI:
             cards_frame = tk.Frame(panel, bg=bg_color)
             cards_frame.pack(pady=5)
 
+            playable = {}
             cards = self.engine.get_player_cards(player_id)
             for card in cards:
-                can_play = self.engine.can_play_card(player_id, card)
-                self.create_card_button(cards_frame, card, player_id, can_play and is_active)
+                can_play = self.engine.can_play_card(player_id, card) and is_active
+                btn = self.create_card_button(cards_frame, card, player_id, can_play)
+                if can_play:
+                    playable[card.suit * 9 + card.rank - 6] = (card, btn)
+
+            self.hint_labels = {}
+            if self.show_hints and playable:
+                self.request_hints(player_id, playable)
+            else:
+                self.hint_key = None
 
     def create_card_button(self, parent, card, player_id, can_play):
         """Створити кнопку карти"""
@@ -355,6 +396,95 @@ class SevenGameGUI:
             command=lambda c=card: self.play_card(player_id, c)
         )
         btn.pack(side=tk.LEFT, padx=2, pady=2)
+        return btn
+
+    def hint_button_text(self):
+        """Текст кнопки підказок"""
+        return "💡 Підказки: увімк." if self.show_hints else "💡 Підказки: вимк."
+
+    def toggle_hints(self):
+        """Увімкнути/вимкнути підказки"""
+        self.show_hints = not self.show_hints
+        self.hint_button.configure(text=self.hint_button_text())
+        if not self.show_hints:
+            self.hint_key = None
+        self.update_player_panel(self.bottom_player_panel, self.bottom_player_id, True)
+
+    def position_key(self, player_id):
+        """Ключ позиції для кешу підказок (однаковий для перестановок мастей)"""
+        key, perm = self.engine.canonical_position(player_id)
+        # Оцінки зберігаються під картами в канонічних мастях
+        self.hint_suits = {original: suit for suit, original in enumerate(perm)}
+        return key
+
+    @staticmethod
+    def canonical_index(index, suits):
+        """Індекс карти (suit * 9 + rank - 6) у канонічних мастях"""
+        return suits[index // 9] * 9 + index % 9
+
+    def request_hints(self, player_id, playable):
+        """Показати оцінки з кешу і запустити уточнення у фоні"""
+        # Оцінки показуються поверх кнопок можливих ходів
+        for index, (card, btn) in playable.items():
+            label = tk.Label(btn.master, text="…", font=("Arial", 8, "bold"),
+                             bg=self.card_bg, fg="#d35400")
+            label.place(in_=btn, relx=0.5, rely=1.0, y=-4, anchor="s")
+            self.hint_labels[index] = label
+
+        key = self.position_key(player_id)
+        self.refresh_hint_labels(key)
+
+        stats = self.hint_cache.get(key, {})
+        suits = self.hint_suits
+        if key != self.hint_key and any(stats.get(self.canonical_index(i, suits), (0, 0))[1] < HINT_MAX_ROLLOUTS
+                                        for i in playable):
+            # Аналіз іде на копії гри, тож не заважає кліку та перемальовуванню
+            self.hint_key = key
+            cards = [card for card, _ in playable.values()]
+            self.hint_jobs.put((key, self.engine.clone(), cards, suits))
+
+    def hint_worker(self):
+        """Фоновий потік: доігрування партіями, поки позиція актуальна"""
+        while True:
+            key, engine, cards, suits = self.hint_jobs.get()
+            stats = self.hint_cache.setdefault(key, {})
+
+            def index_of(card):
+                return self.canonical_index(card.suit * 9 + card.rank - 6, suits)
+
+            while self.hint_key == key:
+                pending = [c for c in cards if stats.get(index_of(c), (0, 0))[1] < HINT_MAX_ROLLOUTS]
+                if not pending:
+                    break
+
+                for card in pending:
+                    index = index_of(card)
+                    wins, total = stats.get(index, (0, 0))
+                    batch_wins = engine.rollout_wins(card, HINT_BATCH, seed=total * 36 + index)
+                    stats[index] = (wins + batch_wins, total + HINT_BATCH)
+
+                self.hint_updates.put(key)
+
+    def poll_hints(self):
+        """Перенести результати фонового потоку в інтерфейс (головний потік)"""
+        updated = set()
+        while not self.hint_updates.empty():
+            updated.add(self.hint_updates.get())
+
+        if self.hint_key in updated:
+            self.refresh_hint_labels(self.hint_key)
+
+        self.root.after(HINT_POLL_MS, self.poll_hints)
+
+    def refresh_hint_labels(self, key):
+        """Оновити оцінки ймовірності перемоги під картами"""
+        stats = self.hint_cache.get(key, {})
+        for index, label in self.hint_labels.items():
+            if not label.winfo_exists():
+                continue
+            wins, total = stats.get(self.canonical_index(index, self.hint_suits), (0, 0))
+            if total:
+                label.configure(text=f"{100 * wins / total:.0f}%")
 
     def update_table(self):
         """Оновити стіл"""
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Навантажувальне тестування рушія гри "Сім"
+
+Окремого серверного шару в проекті немає, тому клієнти працюють з
+SevenGameEngine напряму, в тому самому процесі. Кожен клієнт - це одна
+розміщена гра, яку скриптований клієнт проходить так само, як GUI:
+отримує нові події, запитує можливі ходи, ходить або пропускає хід,
+а після кінця гри отримує нову роздачу.
+
+Для кожного рівня одночасності (кількості ігор) вимірюються:
+    - затримка кожної дії в гістограмах з логарифмічно-лінійними
+      кошиками (як HDR Histogram): p50, p99, p999
+    - пропускна здатність (дій та ігор за секунду)
+    - пам'ять на одну розміщену гру (приріст RSS процесу)
+
+Використання:
+    python seven_game_loadtest.py --levels 1,10,100,1000 --seconds 5 \\
+        --players 4 --output loadtest.json
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import ENGINES, create_engine, resolve_engine
+
+# Дії клієнта, для кожної - окрема гістограма затримок
+ACTIONS = ("deal", "poll_events", "valid_moves", "play_card", "pass_turn")
+
+
+class LatencyHistogram:
+    """
+    Гістограма затримок у наносекундах з логарифмічно-лінійними кошиками
+
+    Значення до 2^SUB_BITS зберігаються точно, більші - у кошиках, де на
+    кожну степінь двійки припадає 2^(SUB_BITS - 1) кошиків (відносна
+    похибка до 1/32). Запис - O(1), пам'ять не залежить від кількості значень.
+    """
+
+    SUB_BITS = 6
+    MAX_BITS = 40  # До ~18 хвилин
+
+    def __init__(self):
+        half = 1 << (self.SUB_BITS - 1)
+        self.counts = [0] * ((1 << self.SUB_BITS) + (self.MAX_BITS - self.SUB_BITS) * half)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < (1 << self.SUB_BITS):
+            return value
+        shift = min(value.bit_length(), self.MAX_BITS) - self.SUB_BITS
+        top = min(value >> shift, (1 << self.SUB_BITS) - 1)
+        half = 1 << (self.SUB_BITS - 1)
+        return (1 << self.SUB_BITS) + (shift - 1) * half + (top - half)
+
+    def _value(self, index: int) -> int:
+        """Середина кошика index"""
+        if index < (1 << self.SUB_BITS):
+            return index
+        half = 1 << (self.SUB_BITS - 1)
+        shift = (index - (1 << self.SUB_BITS)) // half + 1
+        top = (index - (1 << self.SUB_BITS)) % half + half
+        return (top << shift) + (1 << (shift - 1))
+
+    def record(self, value: int):
+        """Записати одне значення (нс)"""
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.min = value if self.min is None else min(self.min, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Додати значення іншої гістограми"""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def percentile(self, q: float) -> int:
+        """Значення, не менше за q відсотків записаних (нс)"""
+        if not self.count:
+            return 0
+        target = max(1, int(round(q / 100 * self.count)))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._value(i), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Підсумок у мікросекундах"""
+        def us(ns):
+            return round(ns / 1000, 3)
+
+        return {"count": self.count,
+                "min_us": us(self.min or 0),
+                "mean_us": us(self.total / self.count) if self.count else 0.0,
+                "p50_us": us(self.percentile(50)),
+                "p99_us": us(self.percentile(99)),
+                "p999_us": us(self.percentile(99.9)),
+                "max_us": us(self.max)}
+
+
+class ScriptedClient:
+    """Клієнт однієї розміщеної гри: випадкові можливі ходи за всіх гравців"""
+
+    def __init__(self, engine, seed: int):
+        self.engine = engine
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.seen = 0
+        self.games = 0
+
+    def step(self, histograms: Dict[str, LatencyHistogram], clock=time.perf_counter_ns):
+        """Один хід клієнта; кожен виклик рушія вимірюється окремо"""
+        engine = self.engine
+
+        start = clock()
+        events = engine.poll_events(self.seen)
+        histograms["poll_events"].record(clock() - start)
+        if events:
+            self.seen = events[-1].seq
+
+        if engine.check_winner() != -1:
+            self.games += 1
+            self.seed += 1
+            start = clock()
+            engine.deal_cards_seeded(self.seed)
+            histograms["deal"].record(clock() - start)
+            return
+
+        player = engine.get_current_player()
+        start = clock()
+        moves = engine.get_valid_moves(player)
+        histograms["valid_moves"].record(clock() - start)
+
+        if moves:
+            card = self.rng.choice(moves)
+            start = clock()
+            engine.play_card(player, card)
+            histograms["play_card"].record(clock() - start)
+        else:
+            start = clock()
+            engine.pass_turn()
+            histograms["pass_turn"].record(clock() - start)
+
+
+def rss_bytes() -> Optional[int]:
+    """Поточний RSS процесу (None - недоступний на цій платформі)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def run_level(clients_count: int, seconds: float, workers: int, num_players: int,
+              engine: str, seed: int) -> dict:
+    """
+    Один рівень навантаження: clients_count одночасних ігор, які
+    обслуговують workers потоків по черзі, протягом seconds секунд
+    """
+    gc.collect()
+    rss_before = rss_bytes()
+
+    clients = []
+    for i in range(clients_count):
+        game = create_engine(num_players, engine)
+        game.deal_cards_seeded(seed + i * 1000003)
+        clients.append(ScriptedClient(game, seed + i * 1000003))
+
+    gc.collect()
+    rss_after = rss_bytes()
+
+    workers = max(1, min(workers, clients_count))
+    histograms = [{name: LatencyHistogram() for name in ACTIONS} for _ in range(workers)]
+    steps = [0] * workers
+    deadline = time.perf_counter() + seconds
+
+    def work(index: int):
+        own = clients[index::workers]
+        local = histograms[index]
+        count = 0
+        while time.perf_counter() < deadline:
+            for client in own:
+                client.step(local)
+            count += len(own)
+        steps[index] = count
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    merged = {name: LatencyHistogram() for name in ACTIONS}
+    for local in histograms:
+        for name in ACTIONS:
+            merged[name].merge(local[name])
+
+    actions = sum(h.count for h in merged.values())
+    games = sum(client.games for client in clients)
+    memory = None
+    if rss_before is not None and rss_after is not None:
+        memory = max(rss_after - rss_before, 0) / clients_count
+
+    return {"clients": clients_count, "workers": workers, "seconds": round(elapsed, 3),
+            "client_steps": sum(steps), "actions": actions, "games_completed": games,
+            "actions_per_sec": round(actions / elapsed, 1),
+            "games_per_sec": round(games / elapsed, 1),
+            "memory_per_game_bytes": round(memory) if memory is not None else None,
+            "latency": {name: merged[name].summary() for name in ACTIONS if merged[name].count}}
+
+
+def run_sweep(levels: List[int], seconds: float = 5.0, workers: int = 0, num_players: int = 4,
+              engine: str = "auto", seed: int = 0, progress=None) -> dict:
+    """Виміряти всі рівні одночасності та зібрати звіт"""
+    engine_name = resolve_engine(engine)
+    workers = workers or os.cpu_count() or 1
+
+    results = []
+    for level in levels:
+        result = run_level(level, seconds, workers, num_players, engine_name, seed)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    return {"engine": engine_name, "players": num_players, "seconds_per_level": seconds,
+            "python": sys.version.split()[0], "cpu_count": os.cpu_count(), "levels": results}
+
+
+def main():
+    """Запуск навантажувального тесту з командного рядка"""
+    parser = argparse.ArgumentParser(description="Навантажувальний тест рушія гри 'Сім'")
+    parser.add_argument("--levels", default="1,10,100,1000",
+                        help="кількості одночасних ігор через кому")
+    parser.add_argument("--seconds", type=float, default=5.0, help="тривалість кожного рівня")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="потоки, що обслуговують ігри (0 - кількість ядер)")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--engine", default="auto", choices=ENGINES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="loadtest.json")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+
+    def progress(result):
+        play = result["latency"].get("play_card", {})
+        memory = result["memory_per_game_bytes"]
+        print(f"  ігор: {result['clients']:6d}  дій/с: {result['actions_per_sec']:10.0f}  "
+              f"ігор/с: {result['games_per_sec']:8.1f}  "
+              f"play_card p50/p99/p999: {play.get('p50_us', 0)}/{play.get('p99_us', 0)}/"
+              f"{play.get('p999_us', 0)} мкс  "
+              f"пам'ять/гру: {memory if memory is not None else '-'} Б")
+
+    report = run_sweep(levels, args.seconds, args.workers, args.players, args.engine,
+                       args.seed, progress)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Звіт збережено: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
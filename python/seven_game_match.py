@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Порівняння двох стратегій AI з ранньою зупинкою (SPRT)
+
+Кандидат грає проти базової стратегії на тих самих роздачах (за seed),
+по черзі займаючи кожне місце за столом. Такі парні ігри зменшують
+дисперсію, а послідовний тест SPRT зупиняє матч, щойно різниця
+статистично вирішена.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import SevenGameEngine
+from seven_game_policies import Policy, get_policy, POLICIES
+
+
+class SPRT:
+    """
+    Узагальнений SPRT для середнього значення результату
+
+    H0: середній результат кандидата = mu0 (не сильніший за базу)
+    H1: середній результат кандидата = mu1 (сильніший на delta)
+    LLR рахується через нормальне наближення, як у шахових тестових серверах.
+
+    Якщо всі результати однакові (вибіркова дисперсія 0 - наприклад,
+    детермінована стратегія завжди виграє), дисперсія береться за
+    Бернуллі в середині між mu0 та mu1: це найбільша можлива дисперсія
+    результату з [0, 1], тож LLR оцінюється обережно, але тест вирішується.
+    """
+
+    def __init__(self, mu0: float, mu1: float, alpha: float = 0.05, beta: float = 0.05):
+        self.mu0 = mu0
+        self.mu1 = mu1
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, score: float):
+        """Додати результат однієї парної гри"""
+        self.count += 1
+        self.total += score
+        self.total_sq += score * score
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        mean = self.mean()
+        return max(self.total_sq / self.count - mean * mean, 0.0)
+
+    def llr(self) -> float:
+        """Логарифм відношення правдоподібності H1 до H0"""
+        var = self.variance()
+        if var <= 0.0:
+            mid = (self.mu0 + self.mu1) / 2
+            var = mid * (1 - mid)
+        mean = self.mean()
+        return self.count * (self.mu1 - self.mu0) * (2 * mean - self.mu0 - self.mu1) / (2 * var)
+
+    def status(self) -> Optional[str]:
+        """'H1' - кандидат сильніший, 'H0' - ні, None - ще не вирішено"""
+        llr = self.llr()
+        if llr >= self.upper:
+            return "H1"
+        if llr <= self.lower:
+            return "H0"
+        return None
+
+
+class MatchResult:
+    """Результат матчу"""
+
+    def __init__(self, decision: Optional[str], games_played: int, pairs_played: int,
+                 score: float, llr: float, cpu_time: float, max_games: int):
+        self.decision = decision
+        self.games_played = games_played
+        self.pairs_played = pairs_played
+        self.score = score
+        self.llr = llr
+        self.cpu_time = cpu_time
+        self.max_games = max_games
+
+        # Скільки часу зекономлено відносно повного фіксованого бюджету
+        per_game = cpu_time / games_played if games_played else 0.0
+        self.cpu_time_saved = per_game * (max_games - games_played)
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+def play_game(engine: SevenGameEngine, seat_policies: List[Policy], seed: int) -> int:
+    """Зіграти одну гру на роздачі seed, повертає номер переможця"""
+    engine.deal_cards_seeded(seed)
+
+    while True:
+        winner = engine.check_winner()
+        if winner != -1:
+            return winner
+
+        player = engine.get_current_player()
+        seat_policies[player](engine, player)
+
+
+def play_pair(engine: SevenGameEngine, candidate: Policy, baseline: Policy, seed: int) -> float:
+    """
+    Парна гра: одна роздача, кандидат по черзі сидить на кожному місці.
+    Повертає частку перемог кандидата.
+    """
+    num_players = engine.num_players
+    wins = 0
+
+    for seat in range(num_players):
+        seat_policies = [baseline] * num_players
+        seat_policies[seat] = candidate
+        if play_game(engine, seat_policies, seed) == seat:
+            wins += 1
+
+    return wins / num_players
+
+
+def run_match(candidate: Policy, baseline: Policy, num_players: int = 2, seed: int = 1,
+              max_games: int = 100000, delta: float = 0.02,
+              alpha: float = 0.05, beta: float = 0.05,
+              min_pairs: int = 100, progress=None) -> MatchResult:
+    """
+    Провести матч кандидата проти базової стратегії
+
+    Args:
+        candidate: Стратегія, яку перевіряємо
+        baseline: Поточна стратегія (наприклад, computerMove)
+        num_players: Кількість гравців (2-4)
+        seed: Початковий seed роздач
+        max_games: Максимальна кількість ігор (фіксований бюджет)
+        delta: Мінімальна перевага в частці перемог для H1
+        alpha, beta: Помилки першого та другого роду
+        min_pairs: Мінімум парних ігор до першої перевірки
+        progress: Необов'язкова функція progress(sprt, games_played)
+
+    Якщо за max_games тест не вирішено, матч зупиняється з decision = None;
+    score та llr показують, до якої гіпотези схилявся результат.
+    """
+    engine = SevenGameEngine(num_players)
+    fair_share = 1.0 / num_players
+    sprt = SPRT(fair_share, fair_share + delta, alpha, beta)
+
+    max_pairs = max(max_games // num_players, 1)
+    decision = None
+    start = time.process_time()
+
+    for pair in range(max_pairs):
+        sprt.add(play_pair(engine, candidate, baseline, seed + pair))
+
+        if progress is not None and sprt.count % 1000 == 0:
+            progress(sprt, sprt.count * num_players)
+
+        if sprt.count >= min_pairs:
+            decision = sprt.status()
+            if decision is not None:
+                break
+
+    cpu_time = time.process_time() - start
+    return MatchResult(decision, sprt.count * num_players, sprt.count,
+                       sprt.mean(), sprt.llr(), cpu_time, max_pairs * num_players)
+
+
+def main():
+    """Запуск матчу з командного рядка"""
+    parser = argparse.ArgumentParser(description="Матч двох стратегій AI з SPRT")
+    parser.add_argument("--candidate", default="greedy", choices=sorted(POLICIES))
+    parser.add_argument("--baseline", default="random", choices=sorted(POLICIES))
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-games", type=int, default=100000)
+    parser.add_argument("--delta", type=float, default=0.02)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    args = parser.parse_args()
+
+    def progress(sprt, games):
+        print(f"  ігор: {games}, результат: {sprt.mean():.4f}, LLR: {sprt.llr():.3f}")
+
+    result = run_match(get_policy(args.candidate), get_policy(args.baseline),
+                       num_players=args.players, seed=args.seed,
+                       max_games=args.max_games, delta=args.delta,
+                       alpha=args.alpha, beta=args.beta, progress=progress)
+
+    verdict = {
+        "H1": "кандидат сильніший",
+        "H0": "кандидат не сильніший",
+        None: "не вирішено в межах бюджету",
+    }[result.decision]
+
+    print(f"\nРезультат: {verdict}")
+    print(f"Зіграно ігор: {result.games_played} з {result.max_games}")
+    print(f"Частка перемог кандидата: {result.score:.4f} (LLR {result.llr:.3f})")
+    print(f"Час CPU: {result.cpu_time:.2f} с, зекономлено: {result.cpu_time_saved:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
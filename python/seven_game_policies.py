@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Стратегії (policies) гравців для гри "Сім"
+
+Стратегія - це функція policy(engine, player_id), яка сама виконує хід
+поточного гравця через SevenGameEngine і повертає зіграну карту
+(або None, якщо гравець пропустив хід).
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from seven_game_engine import SevenGameEngine, Card
+
+Policy = Callable[[SevenGameEngine, int], Optional[Card]]
+
+
+def random_policy(engine: SevenGameEngine, player_id: int) -> Optional[Card]:
+    """Випадковий хід - стандартний AI з C++ (computerMove)"""
+    return engine.computer_move()
+
+
+def play_choice(engine: SevenGameEngine, player_id: int,
+                choose: Callable[[List[Card], List[Card]], Card]) -> Optional[Card]:
+    """
+    Виконати хід, обраний функцією choose(valid_moves, hand)
+
+    Якщо можливих ходів немає - гравець пропускає хід.
+    """
+    hand = engine.get_player_cards(player_id)
+    valid_moves = [card for card in hand if engine.can_play_card(player_id, card)]
+
+    if not valid_moves:
+        engine.pass_turn()
+        return None
+
+    card = choose(valid_moves, hand)
+    engine.play_card(player_id, card)
+    return card
+
+
+def _run_length(card: Card, hand: List[Card]) -> int:
+    """Скільки власних карт тієї ж масті відкриває цей хід"""
+    if card.rank == 7:
+        return sum(1 for c in hand if c.suit == card.suit and c.rank != 7)
+    if card.rank > 7:
+        return sum(1 for c in hand if c.suit == card.suit and c.rank > card.rank)
+    return sum(1 for c in hand if c.suit == card.suit and c.rank < card.rank)
+
+
+def greedy_policy(engine: SevenGameEngine, player_id: int) -> Optional[Card]:
+    """
+    Жадібна стратегія: грає карту, за якою в руці лишається
+    найдовший ланцюжок власних карт цієї масті
+    """
+    return play_choice(
+        engine, player_id,
+        lambda valid_moves, hand: max(valid_moves, key=lambda c: _run_length(c, hand))
+    )
+
+
+_net_ai = None
+
+
+def net_policy(engine: SevenGameEngine, player_id: int) -> Optional[Card]:
+    """
+    Нейромережа policy/value (модель з SEVEN_GAME_MODEL);
+    без моделі - computer_move
+    """
+    global _net_ai
+    if _net_ai is None:
+        from seven_game_policy_net import BatchedPolicyAI
+        _net_ai = BatchedPolicyAI()
+    return _net_ai(engine, player_id)
+
+
+# Реєстр стратегій за назвою (для командного рядка)
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "net": net_policy,
+}
+
+
+def get_policy(name: str) -> Policy:
+    """Отримати стратегію за назвою"""
+    try:
+        return POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Невідома стратегія: {name} (доступні: {', '.join(POLICIES)})")
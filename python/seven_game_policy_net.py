@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI на основі нейромережі (policy/value) з пакетним виведенням на CPU
+
+Рішення AI з багатьох одночасних ігор збираються в один батч за такт,
+кодуються через seven_game_features.encode_batch і проходять через
+мережу одним викликом NumPy. Якщо модель не задана, AI використовує
+стандартний computer_move з C++.
+
+Формат файлу ваг (.npz):
+    hidden_w0, hidden_b0, hidden_w1, hidden_b1, ... - приховані шари (ReLU)
+    policy_w, policy_b - логіти ходів (36)
+    value_w, value_b   - оцінка позиції (tanh)
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import SevenGameEngine, Card
+from seven_game_features import (NUM_CARDS, NUM_PLANES, MAX_PLAYERS,
+                                 encode_batch, index_to_card, position_from_engine)
+
+# Змінна оточення з шляхом до моделі за замовчуванням
+MODEL_ENV = "SEVEN_GAME_MODEL"
+
+
+class PolicyValueNet:
+    """Повнозв'язна мережа policy/value з виведенням на NumPy"""
+
+    def __init__(self, hidden: List[Tuple[np.ndarray, np.ndarray]],
+                 policy: Tuple[np.ndarray, np.ndarray], value: Tuple[np.ndarray, np.ndarray]):
+        self.hidden = [(w.astype(np.float32), b.astype(np.float32)) for w, b in hidden]
+        self.policy = tuple(a.astype(np.float32) for a in policy)
+        self.value = tuple(a.astype(np.float32) for a in value)
+
+    @classmethod
+    def load(cls, path: str) -> "PolicyValueNet":
+        """Завантажити ваги з файлу .npz"""
+        with np.load(path) as data:
+            hidden = []
+            while f"hidden_w{len(hidden)}" in data:
+                i = len(hidden)
+                hidden.append((data[f"hidden_w{i}"], data[f"hidden_b{i}"]))
+            return cls(hidden, (data["policy_w"], data["policy_b"]),
+                       (data["value_w"], data["value_b"]))
+
+    @classmethod
+    def random(cls, hidden_sizes: Sequence[int] = (256, 128), seed: int = 0) -> "PolicyValueNet":
+        """Мережа з випадковими вагами (початкова точка для навчання)"""
+        rng = np.random.default_rng(seed)
+        sizes = [NUM_PLANES * NUM_CARDS] + list(hidden_sizes)
+
+        def layer(n_in, n_out):
+            return (rng.normal(0, np.sqrt(2.0 / n_in), (n_in, n_out)), np.zeros(n_out))
+
+        hidden = [layer(sizes[i], sizes[i + 1]) for i in range(len(hidden_sizes))]
+        return cls(hidden, layer(sizes[-1], NUM_CARDS), layer(sizes[-1], 1))
+
+    def save(self, path: str):
+        """Зберегти ваги у файл .npz"""
+        arrays = {}
+        for i, (w, b) in enumerate(self.hidden):
+            arrays[f"hidden_w{i}"] = w
+            arrays[f"hidden_b{i}"] = b
+        arrays["policy_w"], arrays["policy_b"] = self.policy
+        arrays["value_w"], arrays["value_b"] = self.value
+        np.savez(path, **arrays)
+
+    def forward(self, planes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Виведення для батчу площин (N, NUM_PLANES, 36)
+
+        Returns:
+            (логіти ходів (N, 36), оцінки позицій (N,))
+        """
+        x = planes.reshape(len(planes), -1)
+        for w, b in self.hidden:
+            x = np.maximum(x @ w + b, 0.0)
+
+        logits = x @ self.policy[0] + self.policy[1]
+        values = np.tanh(x @ self.value[0] + self.value[1])[:, 0]
+        return logits, values
+
+
+class BatchedPolicyAI:
+    """
+    AI, що приймає рішення одразу для багатьох ігор
+
+    Args:
+        net: Мережа; якщо None - береться з SEVEN_GAME_MODEL, інакше computer_move
+        ai_players: Номери гравців, за яких ходить AI (None - за всіх)
+    """
+
+    def __init__(self, net: Optional[PolicyValueNet] = None, ai_players: Optional[Iterable[int]] = None):
+        if net is None and os.environ.get(MODEL_ENV):
+            net = PolicyValueNet.load(os.environ[MODEL_ENV])
+        self.net = net
+        self.ai_players = set(ai_players) if ai_players is not None else None
+        self._planes = np.empty((0, NUM_PLANES, NUM_CARDS), dtype=np.float32)
+
+    def is_ai_turn(self, engine: SevenGameEngine) -> bool:
+        """Чи очікує гра на хід AI"""
+        if engine.check_winner() != -1:
+            return False
+        return self.ai_players is None or engine.get_current_player() in self.ai_players
+
+    def step(self, engines: Sequence[SevenGameEngine]) -> List[Optional[Card]]:
+        """
+        Один такт: зробити хід AI у кожній грі, що на нього очікує
+
+        Returns:
+            Для кожної гри: зіграна карта або None (пропуск або не хід AI)
+        """
+        results: List[Optional[Card]] = [None] * len(engines)
+        pending = [i for i, engine in enumerate(engines) if self.is_ai_turn(engine)]
+        if not pending:
+            return results
+
+        if self.net is None:
+            for i in pending:
+                results[i] = engines[i].computer_move()
+            return results
+
+        count = len(pending)
+        hands = np.empty(count, dtype=np.uint64)
+        table_lo = np.empty((count, 4), dtype=np.int8)
+        table_hi = np.empty((count, 4), dtype=np.int8)
+        counts = np.empty((count, MAX_PLAYERS), dtype=np.int8)
+        players = []
+
+        for row, i in enumerate(pending):
+            player = engines[i].get_current_player()
+            hands[row], table_lo[row], table_hi[row], counts[row] = position_from_engine(engines[i], player)
+            players.append(player)
+
+        # Буфер площин перевикористовується між тактами
+        if len(self._planes) < count:
+            self._planes = np.empty((count, NUM_PLANES, NUM_CARDS), dtype=np.float32)
+        planes = encode_batch(hands, table_lo, table_hi, counts, out=self._planes[:count])
+
+        logits, _ = self.net.forward(planes)
+        legal = planes[:, 2] > 0
+        logits = np.where(legal, logits, -np.inf)
+        choices = np.argmax(logits, axis=1)
+        has_move = legal.any(axis=1)
+
+        for row, i in enumerate(pending):
+            card = index_to_card(int(choices[row])) if has_move[row] else None
+            if card is not None and engines[i].play_card(players[row], card):
+                results[i] = card
+            else:
+                # Немає ходу або рушій відхилив хід - пропуск, щоб гра не зациклилась
+                engines[i].pass_turn()
+
+        return results
+
+    def __call__(self, engine: SevenGameEngine, player_id: int) -> Optional[Card]:
+        """Використання як звичайної стратегії (батч з однієї гри)"""
+        return self.step([engine])[0]
+
+
+def run_concurrent_games(ai: BatchedPolicyAI, num_games: int, num_players: int = 2,
+                         seed: int = 0) -> Tuple[int, float]:
+    """
+    Зіграти num_games одночасних ігор, де всі ходи робить AI
+
+    Returns:
+        (кількість рішень AI, час у секундах)
+    """
+    engines = []
+    for i in range(num_games):
+        engine = SevenGameEngine(num_players)
+        engine.deal_cards_seeded(seed + i)
+        engines.append(engine)
+
+    decisions = 0
+    start = time.perf_counter()
+
+    active = engines
+    while active:
+        decisions += len(active)
+        ai.step(active)
+        active = [engine for engine in active if engine.check_winner() == -1]
+
+    return decisions, time.perf_counter() - start
+
+
+def main():
+    """Вимірювання швидкості пакетного AI"""
+    parser = argparse.ArgumentParser(description="Пакетний AI policy/value на CPU")
+    parser.add_argument("--model", help=f"файл ваг .npz (або змінна {MODEL_ENV})")
+    parser.add_argument("--random-model", action="store_true", help="мережа з випадковими вагами")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    net = None
+    if args.model:
+        net = PolicyValueNet.load(args.model)
+    elif args.random_model:
+        net = PolicyValueNet.random(seed=args.seed)
+
+    ai = BatchedPolicyAI(net)
+    decisions, elapsed = run_concurrent_games(ai, args.games, args.players, args.seed)
+
+    mode = "мережа" if ai.net is not None else "computer_move"
+    print(f"AI ({mode}): {decisions} рішень за {elapsed:.2f} с "
+          f"({decisions / elapsed:.0f} рішень/с)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Рушій гри "Сім" на чистому Python з тим самим API, що й SevenGameEngine
+
+Правила беруться з консольної версії (seven_game.SevenGame та
+Player.get_valid_moves), а карти та стан повертаються у тих самих
+структурах ctypes, що й C++ рушій. Працює без скомпільованої бібліотеки.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import copy
+import random
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from seven_game import SevenGame, Player
+from seven_game_belief import FULL_DECK, HandSampler, card_bit, playable_mask, table_mask
+from seven_game_symmetry import canonical_position
+from seven_game_types import (Card, GameState, GameStateEx, Event, STANDARD_RANKS,
+                              EVENT_BUFFER_SIZE, EVENT_CARD_PLAYED, EVENT_PASS, EVENT_TURN,
+                              EVENT_GAME_OVER, EVENT_DEAL)
+
+
+class EventLog:
+    """Кільцевий буфер подій (як EventLog у C++)"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.next_seq = 1
+        self.ring = deque(maxlen=EVENT_BUFFER_SIZE)
+
+    def push(self, event_type: int, player: int, card: Optional[Card] = None):
+        if not self.enabled:
+            return
+        self.ring.append(Event(self.next_seq, event_type, player, card or Card(0, 0)))
+        self.next_seq += 1
+
+    def poll(self, since_seq: int, max_events: int) -> List[Event]:
+        if not self.ring or since_seq + 1 >= self.next_seq:
+            return []
+        start = max(since_seq + 1 - self.ring[0].seq, 0)
+        return [self.ring[i] for i in range(start, min(start + max_events, len(self.ring)))]
+
+
+class DealSolver:
+    """
+    Точний розв'язувач позиції 2 гравців (як DealSolver у C++)
+
+    Карти поза столом вже розподілені між гравцями, тож позицію однозначно
+    задають межі столу та гравець, що ходить; результати кешуються за ними.
+    Результат - (переможець, кількість ходів до кінця гри).
+    """
+
+    def __init__(self, hands: Tuple[int, int], table: Dict[int, Tuple[int, int]]):
+        self.hands = list(hands)
+        self.lo = [table[suit][0] if suit in table else 0 for suit in range(4)]
+        self.hi = [table[suit][1] if suit in table else 0 for suit in range(4)]
+        self.memo: Dict[Tuple[tuple, int], Tuple[int, int]] = {}
+
+    def moves(self, hand: int) -> List[Tuple[int, int]]:
+        """Можливі ходи руки hand: (rank, suit)"""
+        result = []
+        for suit in range(4):
+            lo, hi = self.lo[suit], self.hi[suit]
+            candidates = (7,) if not lo else (lo - 1, hi + 1)
+            for rank in candidates:
+                if 6 <= rank <= 14 and hand & card_bit(rank, suit):
+                    result.append((rank, suit))
+        return result
+
+    @staticmethod
+    def better(a: Tuple[int, int], b: Tuple[int, int], side: int) -> bool:
+        """Чи кращий результат a за b для гравця side"""
+        a_wins, b_wins = a[0] == side, b[0] == side
+        if a_wins != b_wins:
+            return a_wins
+        if a_wins:
+            return a[1] < b[1]  # Виграємо швидше
+        return a[1] > b[1]      # Програємо якомога довше
+
+    def solve(self, side: int) -> Tuple[int, int]:
+        key = (tuple(self.lo), tuple(self.hi)), side
+        if key in self.memo:
+            return self.memo[key]
+
+        moves = self.moves(self.hands[side])
+        if not moves:
+            if not self.moves(self.hands[1 - side]):
+                # Всі пропустили: перемагає гравець з меншою кількістю карт
+                counts = [bin(hand).count("1") for hand in self.hands]
+                best = (1 if counts[1] < counts[0] else 0, 2)
+            else:
+                winner, plies = self.solve(1 - side)
+                best = (winner, plies + 1)
+        else:
+            best = None
+            for rank, suit in moves:
+                saved = self.lo[suit], self.hi[suit]
+                bit = card_bit(rank, suit)
+
+                if not self.lo[suit]:
+                    self.lo[suit] = self.hi[suit] = rank
+                elif rank < self.lo[suit]:
+                    self.lo[suit] = rank
+                else:
+                    self.hi[suit] = rank
+                self.hands[side] &= ~bit
+
+                if not self.hands[side]:
+                    result = (side, 1)
+                else:
+                    winner, plies = self.solve(1 - side)
+                    result = (winner, plies + 1)
+
+                self.hands[side] |= bit
+                self.lo[suit], self.hi[suit] = saved
+
+                if best is None or self.better(result, best, side):
+                    best = result
+
+        self.memo[key] = best
+        return best
+
+
+class PySevenGameEngine:
+    """Рушій гри на Python (API як у SevenGameEngine)"""
+
+    SUIT_NAMES = ["Черви", "Буби", "Хрести", "Піки"]
+    SUIT_SYMBOLS = ["♥", "♦", "♣", "♠"]
+
+    def __init__(self, num_players: int = 2, min_rank: int = STANDARD_RANKS[0],
+                 max_rank: int = STANDARD_RANKS[1], num_decks: int = 1):
+        """
+        Ініціалізація гри
+
+        Args:
+            num_players: Кількість гравців (2-4)
+            min_rank, max_rank, num_decks: Колода - підтримується лише
+                стандартна (інші колоди - у C++ рушії)
+        """
+        if not 2 <= num_players <= 4:
+            raise ValueError(f"Рушій на Python підтримує 2-4 гравці (гравців {num_players})")
+        if (min_rank, max_rank, num_decks) != STANDARD_RANKS + (1,):
+            raise ValueError(f"Рушій на Python підтримує лише стандартну колоду "
+                             f"(ранги {min_rank}-{max_rank}, колод {num_decks})")
+        self.num_players = num_players
+        self.min_rank, self.max_rank = STANDARD_RANKS
+        self.num_decks = 1
+        self.rng = random.Random()
+        self.event_log = EventLog()
+        self.game_over = False
+        self._new_game()
+
+    def _new_game(self):
+        """Нова гра з порожнім столом"""
+        self.game = SevenGame()
+        for i in range(self.num_players):
+            self.game.add_player(Player(f"Гравець {i + 1}"))
+        self.game_over = False
+        self.pass_exclusions = [0] * self.num_players
+
+    def _dealt(self):
+        """Події нової роздачі"""
+        self.event_log.push(EVENT_DEAL, -1)
+        self.event_log.push(EVENT_TURN, self.game.current_player)
+
+    def _push_turn_events(self):
+        """Подія після ходу: кінець гри (один раз) або перехід ходу"""
+        if not self.event_log.enabled or self.game_over:
+            return
+
+        winner = self.check_winner()
+        if winner != -1:
+            self.game_over = True
+            self.event_log.push(EVENT_GAME_OVER, winner)
+        else:
+            self.event_log.push(EVENT_TURN, self.game.current_player)
+
+    def _find_card(self, player_id: int, card: Card) -> int:
+        """Індекс карти в руці гравця (-1 якщо немає)"""
+        for i, c in enumerate(self.game.players[player_id].hand):
+            if c.rank == card.rank and c.suit.value == card.suit:
+                return i
+        return -1
+
+    def _table(self) -> Dict[int, Tuple[int, int]]:
+        """Стіл з номерами мастей замість Suit"""
+        return {suit.value: bounds for suit, bounds in self.game.table.items()}
+
+    def clone(self) -> "PySevenGameEngine":
+        """Незалежна копія гри (копія подій не записує)"""
+        event_log, self.event_log = self.event_log, EventLog(enabled=False)
+        try:
+            return copy.deepcopy(self)
+        finally:
+            self.event_log = event_log
+
+    def deal_cards(self):
+        """Роздати карти"""
+        self._new_game()
+        self.game.deal_cards()
+        self._dealt()
+
+    def deal_cards_seeded(self, seed: int):
+        """Роздати карти за seed (така сама роздача, як у C++)"""
+        self._new_game()
+        self.game.deal_cards(seed)
+        self.rng.seed(seed)
+        self._dealt()
+
+    def get_state(self) -> GameState:
+        """Отримати стан гри"""
+        state = GameState()
+        state.current_player = self.game.current_player
+        state.num_players = self.num_players
+
+        for i, player in enumerate(self.game.players):
+            state.player_cards_count[i] = player.get_card_count()
+
+        for suit, (min_rank, max_rank) in self.game.table.items():
+            for idx, rank in enumerate(range(min_rank, max_rank + 1)):
+                state.table_state[suit.value][idx] = Card(rank, suit.value)
+            state.table_card_count[suit.value] = max_rank - min_rank + 1
+
+        return state
+
+    def get_state_ex(self) -> GameStateEx:
+        """Отримати стан гри у форматі GameStateEx (ряд масті suit - row suit)"""
+        state = GameStateEx.allocate(self.num_players, 4)
+        state.current_player = self.game.current_player
+        state.num_players = self.num_players
+        state.num_rows = 4
+
+        for i, player in enumerate(self.game.players):
+            state.player_cards_count[i] = player.get_card_count()
+
+        for suit, (min_rank, max_rank) in self.game.table.items():
+            state.row_low[suit.value] = min_rank
+            state.row_high[suit.value] = max_rank
+
+        return state
+
+    def get_player_cards(self, player_id: int) -> List[Card]:
+        """Отримати карти гравця"""
+        if not 0 <= player_id < self.num_players:
+            return []
+        return [Card(c.rank, c.suit.value) for c in self.game.players[player_id].hand]
+
+    def get_hand_mask(self, player_id: int) -> int:
+        """Карти гравця як бітова маска (біт suit * 9 + (rank - 6))"""
+        mask = 0
+        for card in self.get_player_cards(player_id):
+            mask |= 1 << (card.suit * 9 + card.rank - 6)
+        return mask
+
+    def can_play_card(self, player_id: int, card: Card) -> bool:
+        """Перевірити чи можна зіграти карту"""
+        if not 0 <= player_id < self.num_players:
+            return False
+        index = self._find_card(player_id, card)
+        return index != -1 and index in self.game.players[player_id].get_valid_moves(self.game.table)
+
+    def play_card(self, player_id: int, card: Card) -> bool:
+        """Зіграти карту"""
+        if not self.can_play_card(player_id, card):
+            return False
+
+        played = self.game.players[player_id].play_card(self._find_card(player_id, card))
+        self.game.place_card(played)
+        self.game.consecutive_passes[player_id] = 0
+        self.game.next_player()
+
+        self.event_log.push(EVENT_CARD_PLAYED, player_id, Card(card.rank, card.suit))
+        self._push_turn_events()
+        return True
+
+    def pass_turn(self):
+        """Пропустити хід"""
+        self.event_log.push(EVENT_PASS, self.game.current_player)
+        # Пропуск означає, що жодної з можливих зараз карт у гравця немає
+        self.pass_exclusions[self.game.current_player] |= playable_mask(self._table())
+        self.game.pass_turn()
+        self._push_turn_events()
+
+    def check_winner(self) -> int:
+        """Перевірити переможця (-1 якщо гра продовжується)"""
+        for i, player in enumerate(self.game.players):
+            if not player.has_cards():
+                return i
+
+        if self.game.all_players_passed():
+            # При рівній кількості карт перемагає гравець з меншим номером
+            return self.game.players.index(self.game.get_winners()[0])
+
+        return -1
+
+    def get_current_player(self) -> int:
+        """Отримати поточного гравця"""
+        return self.game.current_player
+
+    def computer_move(self) -> Optional[Card]:
+        """Хід комп'ютера (випадковий можливий хід)"""
+        player = self.game.players[self.game.current_player]
+        valid_moves = player.get_valid_moves(self.game.table)
+
+        if not valid_moves:
+            self.pass_turn()
+            return None
+
+        selected = player.hand[self.rng.choice(valid_moves)]
+        card = Card(selected.rank, selected.suit.value)
+        self.play_card(self.game.current_player, card)
+        return card
+
+    def play_out(self) -> int:
+        """Доіграти гру ходами комп'ютера; повертає переможця"""
+        while self.check_winner() == -1:
+            self.computer_move()
+        return self.check_winner()
+
+    def hand_strength(self, player_id: int) -> float:
+        """Оцінка імовірності перемоги за роздачею (seven_game_strength)"""
+        from seven_game_strength import engine_hand_strength
+        return engine_hand_strength(self, player_id)
+
+    def get_valid_moves(self, player_id: int) -> List[Card]:
+        """Отримати список можливих ходів для гравця"""
+        player = self.game.players[player_id]
+        return [Card(player.hand[i].rank, player.hand[i].suit.value)
+                for i in player.get_valid_moves(self.game.table)]
+
+    def rollout_wins(self, card: Card, rollouts: int, seed: int = 0) -> int:
+        """
+        Оцінити хід поточного гравця випадковими доігруваннями
+        (карти суперників перерозподіляються випадково)
+
+        Returns:
+            Кількість перемог з rollouts (-1 якщо хід неможливий)
+        """
+        player_id = self.game.current_player
+        if not self.can_play_card(player_id, card):
+            return -1
+
+        rng = random.Random(seed)
+        opponents = [p for i, p in enumerate(self.game.players) if i != player_id]
+        hidden = [c for p in opponents for c in p.hand]
+        cards = {c.suit.value * 9 + c.rank - 6: c for c in hidden}
+
+        # Руки суперників вибираються сумісно з їхніми пропусками; якщо
+        # сумісного розподілу немає (добровільні пропуски) - просто перемішуються
+        sampler = self._hand_sampler(player_id)
+
+        wins = 0
+        for _ in range(rollouts):
+            sim = self.clone()
+            sim.rng.seed(rng.random())
+
+            if sampler.consistent:
+                masks = iter(sampler.sample(rng))
+                for i, p in enumerate(sim.game.players):
+                    if i != player_id:
+                        mask = next(masks)
+                        p.hand = [cards[bit] for bit in range(36) if mask >> bit & 1]
+            else:
+                rng.shuffle(hidden)
+                start = 0
+                for i, p in enumerate(sim.game.players):
+                    if i != player_id:
+                        count = p.get_card_count()
+                        p.hand = sorted(hidden[start:start + count])
+                        start += count
+
+            sim.play_card(player_id, card)
+            while sim.check_winner() == -1:
+                sim.computer_move()
+            if sim.check_winner() == player_id:
+                wins += 1
+
+        return wins
+
+    def get_pass_exclusions(self, player_id: int) -> int:
+        """Карти, яких гравець точно не має (за його пропусками), як бітова маска"""
+        if not 0 <= player_id < self.num_players:
+            return 0
+        return self.pass_exclusions[player_id]
+
+    def _hand_sampler(self, observer: int) -> HandSampler:
+        """Вибірка рук суперників з точки зору гравця observer"""
+        hidden = FULL_DECK & ~table_mask(self._table()) & ~self.get_hand_mask(observer)
+        opponents = [p for p in range(self.num_players) if p != observer]
+        return HandSampler(hidden,
+                           [self.game.players[p].get_card_count() for p in opponents],
+                           [self.pass_exclusions[p] for p in opponents])
+
+    def sample_hands(self, observer: int, count: int, seed: int = 0) -> List[Tuple[int, ...]]:
+        """
+        Рівномірні розподіли прихованих карт з точки зору observer,
+        сумісні з пропусками суперників
+
+        Returns:
+            count кортежів масок рук усіх гравців (рука observer - справжня);
+            порожній список, якщо сумісного розподілу немає
+        """
+        sampler = self._hand_sampler(observer)
+        if not sampler.consistent:
+            return []
+
+        rng = random.Random(seed)
+        own = self.get_hand_mask(observer)
+        samples = []
+        for _ in range(count):
+            masks = iter(sampler.sample(rng))
+            samples.append(tuple(own if p == observer else next(masks)
+                                 for p in range(self.num_players)))
+        return samples
+
+    def canonical_position(self, observer: int) -> Tuple[tuple, List[int]]:
+        """
+        Ключ позиції з точки зору observer, однаковий для всіх перестановок
+        мастей (для кешів), та perm[канонічна масть] = початкова масть
+        """
+        return canonical_position(self, observer)
+
+    def poll_events(self, since_seq: int = 0) -> List[Event]:
+        """Нові події з номером більше since_seq (не більше 64 за виклик)"""
+        return self.event_log.poll(since_seq, 64)
+
+    def events(self, since_seq: int = 0) -> Iterator[Event]:
+        """Ітератор по всіх нових подіях з номером більше since_seq"""
+        while True:
+            batch = self.poll_events(since_seq)
+            if not batch:
+                return
+            yield from batch
+            since_seq = batch[-1].seq
+
+    def solve(self) -> Tuple[int, int]:
+        """
+        Розв'язати позицію при оптимальній грі обох гравців (лише 2 гравці)
+
+        Returns:
+            (переможець, кількість ходів до кінця гри); переможець -1,
+            якщо кількість гравців не підтримується
+        """
+        if self.num_players != 2:
+            return -1, 0
+
+        winner = self.check_winner()
+        if winner != -1:
+            return winner, 0
+
+        solver = DealSolver((self.get_hand_mask(0), self.get_hand_mask(1)), self._table())
+        return solver.solve(self.game.current_player)
+
+    def tablebase_probe(self) -> Optional[Tuple[int, int]]:
+        """Таблиця ендшпілів доступна лише в C++ рушії"""
+        return None
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пакетна симуляція ігор "Сім" без участі людини
+
+Запуск:
+    python -m seven_game_engine simulate --games 1000000 --players 4 \\
+        --jobs 8 --seed 1 --policy random --output results.json
+
+Турнірні варіанти (C++ рушій): до 8 гравців, --min-rank 2 - колода
+з 52 карт, --decks 2 - подвійна колода.
+
+Прогрес та проміжні підсумки виводяться у stdout як JSON lines
+(по одному об'єкту JSON на рядок), фінальний результат також
+записується у файл --output.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import ENGINES, create_engine, resolve_engine
+from seven_game_policies import POLICIES, get_policy
+from seven_game_types import STANDARD_RANKS
+
+# Стандартна колода: (min_rank, max_rank, num_decks)
+STANDARD_DECK = STANDARD_RANKS + (1,)
+
+
+def simulate_chunk(task: Tuple[int, int, int, int, str, str, Tuple[int, int, int]]) -> dict:
+    """
+    Зіграти частину ігор і повернути підсумки
+
+    Args:
+        task: (перша гра, кількість ігор, гравців, seed, стратегія, рушій,
+               колода (min_rank, max_rank, num_decks))
+    """
+    first_game, count, num_players, seed, policy_name, engine_name, deck = task
+
+    engine = create_engine(num_players, engine_name, *deck)
+    policy = get_policy(policy_name)
+    totals = new_totals(num_players)
+    start = time.process_time()
+
+    for game in range(first_game, first_game + count):
+        engine.deal_cards_seeded(seed + game)
+
+        winner = engine.check_winner()
+        while winner == -1:
+            player = engine.get_current_player()
+            if policy(engine, player) is None:
+                totals["passes"] += 1
+            totals["moves"] += 1
+            winner = engine.check_winner()
+
+        totals["wins"][winner] += 1
+        if engine.get_player_cards(winner):
+            # Гра закінчилась тим, що всі пропустили хід
+            totals["pass_endings"] += 1
+
+    totals["games"] = count
+    totals["cpu_time"] = time.process_time() - start
+    return totals
+
+
+def new_totals(num_players: int) -> dict:
+    """Порожні підсумки"""
+    return {"games": 0, "wins": [0] * num_players, "moves": 0,
+            "passes": 0, "pass_endings": 0, "cpu_time": 0.0}
+
+
+def merge_totals(totals: dict, chunk: dict):
+    """Додати підсумки частини до загальних"""
+    for key in ("games", "moves", "passes", "pass_endings", "cpu_time"):
+        totals[key] += chunk[key]
+    for i, wins in enumerate(chunk["wins"]):
+        totals["wins"][i] += wins
+
+
+def summarize(totals: dict) -> dict:
+    """Підсумки з похідними величинами (частки перемог, середні)"""
+    games = max(totals["games"], 1)
+    summary = dict(totals)
+    summary["win_rate"] = [wins / games for wins in totals["wins"]]
+    summary["mean_moves"] = totals["moves"] / games
+    summary["mean_passes"] = totals["passes"] / games
+    return summary
+
+
+def emit(record: dict):
+    """Вивести один рядок JSON lines"""
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def simulate(games: int, num_players: int = 2, jobs: int = 1, seed: int = 0,
+             policy: str = "random", engine: str = "auto",
+             chunk_size: int = 10000, report_every: int = 100000,
+             deck: Tuple[int, int, int] = STANDARD_DECK) -> dict:
+    """
+    Зіграти games ігор у jobs процесах з потоковим виводом прогресу
+
+    Returns:
+        Фінальні підсумки
+    """
+    # Визначаємо рушій один раз, щоб усі процеси використовували однаковий
+    engine_name = resolve_engine(engine)
+
+    tasks = [(start, min(chunk_size, games - start), num_players, seed, policy, engine_name, deck)
+             for start in range(0, games, chunk_size)]
+
+    totals = new_totals(num_players)
+    started = time.time()
+    next_report = report_every
+
+    def consume(chunks):
+        nonlocal next_report
+        for chunk in chunks:
+            merge_totals(totals, chunk)
+            elapsed = time.time() - started
+            emit({"type": "progress", "games": totals["games"], "total": games,
+                  "elapsed": round(elapsed, 3),
+                  "games_per_sec": round(totals["games"] / elapsed, 1) if elapsed else None})
+
+            if totals["games"] >= next_report:
+                emit(dict(summarize(totals), type="aggregate"))
+                next_report += report_every
+
+    if jobs == 1:
+        consume(simulate_chunk(task) for task in tasks)
+    else:
+        with multiprocessing.Pool(jobs or None) as pool:
+            consume(pool.imap_unordered(simulate_chunk, tasks))
+
+    final = summarize(totals)
+    final.update(type="final", engine=engine_name, policy=policy, players=num_players,
+                 deck=list(deck), seed=seed, wall_time=round(time.time() - started, 3))
+    return final
+
+
+def add_arguments(parser):
+    """Аргументи команди simulate"""
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--jobs", type=int, default=1, help="кількість процесів (0 - всі ядра)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", default="random", choices=sorted(POLICIES))
+    parser.add_argument("--engine", default="auto", choices=ENGINES)
+    parser.add_argument("--min-rank", type=int, default=STANDARD_DECK[0],
+                        help="найменший ранг колоди (2 - колода з 52 карт)")
+    parser.add_argument("--max-rank", type=int, default=STANDARD_DECK[1])
+    parser.add_argument("--decks", type=int, default=STANDARD_DECK[2], help="кількість колод")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--report-every", type=int, default=100000,
+                        help="як часто (в іграх) виводити проміжні підсумки")
+    parser.add_argument("--output", default="simulation_results.json")
+
+
+def run(args):
+    """Виконати команду simulate"""
+    final = simulate(args.games, args.players, args.jobs, args.seed, args.policy,
+                     args.engine, args.chunk_size, args.report_every,
+                     (args.min_rank, args.max_rank, args.decks))
+    emit(final)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(final, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Оцінка сили роздачі гри "Сім" за таблицею
+
+Таблиця будується один раз масовою самогрою C++ рушія (ходи
+computer_move за всіх гравців) і зберігає імовірність перемоги для
+кожної комбінації ознак роздачі:
+    - кількість гравців (2-4) та місце за столом (0 ходить першим)
+    - кількість сімок (0-4)
+    - кількість крайніх карт - шісток і тузів, що блокують масть (0-8)
+    - довжина найдовшої масті (0-9)
+
+Рідкісні комбінації згладжуються до середньої частки перемог свого
+місця, тож таблиця не має порожніх клітинок. Готова таблиця
+(data/hand_strength.npz) постачається разом з модулем, і
+engine.hand_strength(player) оцінює роздачу миттєво.
+
+Використання:
+    python seven_game_strength.py build --games 1000000 --jobs 8
+    python seven_game_strength.py info
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_types import is_standard_game
+
+# Таблиця, що постачається з модулем
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "hand_strength.npz")
+
+# Розміри таблиці: гравці (2-4), місце, сімки, крайні карти, найдовша масть
+TABLE_SHAPE = (3, 4, 5, 9, 10)
+
+# Маски карт за рангом (біт suit * 9 + (rank - 6))
+SEVENS_MASK = sum(1 << (suit * 9 + 1) for suit in range(4))
+EXTREMES_MASK = sum((1 << (suit * 9)) | (1 << (suit * 9 + 8)) for suit in range(4))
+SUIT_MASK = (1 << 9) - 1
+
+_table: Optional[np.ndarray] = None
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def hand_features(mask: int) -> Tuple[int, int, int]:
+    """Ознаки руки: (сімки, шістки та тузи, довжина найдовшої масті)"""
+    longest = max(popcount((mask >> (suit * 9)) & SUIT_MASK) for suit in range(4))
+    return popcount(mask & SEVENS_MASK), popcount(mask & EXTREMES_MASK), longest
+
+
+def table_index(num_players: int, seat: int, mask: int) -> Tuple[int, ...]:
+    """Клітинка таблиці для руки mask гравця на місці seat"""
+    return (num_players - 2, seat) + hand_features(mask)
+
+
+def count_chunk(task: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Зіграти частину ігор самогри і порахувати перемоги по клітинках
+
+    Args:
+        task: (кількість гравців, перший seed, кількість ігор)
+    """
+    from seven_game_engine import NativeSevenGameEngine
+
+    num_players, seed_start, count = task
+    wins = np.zeros(TABLE_SHAPE, dtype=np.int64)
+    games = np.zeros(TABLE_SHAPE, dtype=np.int64)
+
+    engine = NativeSevenGameEngine(num_players)
+    for seed in range(seed_start, seed_start + count):
+        engine.deal_cards_seeded(seed)
+        cells = [table_index(num_players, p, engine.get_hand_mask(p)) for p in range(num_players)]
+        winner = engine.play_out()
+        for p, cell in enumerate(cells):
+            games[cell] += 1
+            if p == winner:
+                wins[cell] += 1
+
+    return wins, games
+
+
+def build_counts(games: int, players: Sequence[int] = (2, 3, 4), jobs: int = 0, seed: int = 0,
+                 chunk_size: int = 50000, progress=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Самогра games ігор для кожної кількості гравців у пулі процесів"""
+    tasks = [(num_players, seed + start, min(chunk_size, games - start))
+             for num_players in players for start in range(0, games, chunk_size)]
+
+    wins = np.zeros(TABLE_SHAPE, dtype=np.int64)
+    totals = np.zeros(TABLE_SHAPE, dtype=np.int64)
+    done = 0
+
+    with multiprocessing.Pool(jobs or None) as pool:
+        for (chunk_wins, chunk_games), task in zip(pool.imap(count_chunk, tasks), tasks):
+            wins += chunk_wins
+            totals += chunk_games
+            done += task[2]
+            if progress is not None:
+                progress(done, games * len(players))
+
+    return wins, totals
+
+
+def smooth(wins: np.ndarray, games: np.ndarray, prior_games: float = 20.0) -> np.ndarray:
+    """
+    Імовірності перемоги, згладжені до середньої частки перемог місця
+
+    Клітинка з n іграми отримує (перемоги + prior_games * p) / (n + prior_games),
+    де p - частка перемог гравця на цьому місці по всіх роздачах.
+    """
+    seat_wins = wins.sum(axis=(2, 3, 4), keepdims=True)
+    seat_games = games.sum(axis=(2, 3, 4), keepdims=True)
+    prior = np.where(seat_games > 0, seat_wins / np.maximum(seat_games, 1), 0.0)
+    return ((wins + prior_games * prior) / (games + prior_games)).astype(np.float32)
+
+
+def save_table(path: str, wins: np.ndarray, games: np.ndarray):
+    """Зберегти згладжену таблицю та кількість ігор у клітинках"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez_compressed(path, strength=smooth(wins, games),
+                        games=games.astype(np.uint32))
+
+
+def load_table(path: str = TABLE_PATH) -> np.ndarray:
+    """Завантажити таблицю (таблиця за замовчуванням кешується)"""
+    global _table
+    if path == TABLE_PATH and _table is not None:
+        return _table
+
+    with np.load(path) as data:
+        table = data["strength"]
+    if table.shape != TABLE_SHAPE:
+        raise ValueError(f"{path}: неочікуваний розмір таблиці {table.shape}")
+
+    if path == TABLE_PATH:
+        _table = table
+    return table
+
+
+def hand_strength(mask: int, seat: int, num_players: int) -> float:
+    """Імовірність перемоги руки mask на місці seat (0 ходить першим)"""
+    return float(load_table()[table_index(num_players, seat, mask)])
+
+
+def engine_hand_strength(engine, player_id: int) -> float:
+    """Оцінка руки гравця одразу після роздачі (engine.hand_strength)"""
+    if not is_standard_game(engine):
+        raise ValueError("Таблиця сили роздачі - лише для стандартної гри з 2-4 гравцями")
+    return hand_strength(engine.get_hand_mask(player_id), player_id, engine.num_players)
+
+
+def main():
+    """Запуск з командного рядка"""
+    parser = argparse.ArgumentParser(description="Таблиця сили роздачі гри 'Сім'")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="побудувати таблицю самогрою")
+    build.add_argument("--games", type=int, default=1000000,
+                       help="ігор для кожної кількості гравців")
+    build.add_argument("--jobs", type=int, default=0, help="кількість процесів (0 - всі ядра)")
+    build.add_argument("--seed", type=int, default=0)
+    build.add_argument("--output", default=TABLE_PATH)
+
+    info = commands.add_parser("info", help="вміст таблиці")
+    info.add_argument("path", nargs="?", default=TABLE_PATH)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        def progress(done, total):
+            print(f"  зіграно ігор: {done} з {total}")
+
+        wins, games = build_counts(args.games, jobs=args.jobs, seed=args.seed, progress=progress)
+        save_table(args.output, wins, games)
+        print(f"Таблицю збережено: {args.output}")
+        return
+
+    with np.load(args.path) as data:
+        strength, games = data["strength"], data["games"]
+    for index, num_players in enumerate((2, 3, 4)):
+        for seat in range(num_players):
+            cell_games = games[index, seat]
+            cells = strength[index, seat][cell_games > 0]
+            print(f"Гравців: {num_players}, місце {seat}: ігор {int(cell_games.sum())}, "
+                  f"сила руки від {cells.min():.3f} до {cells.max():.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Симетрія мастей гри "Сім"
+
+Правила не розрізняють масті (кольори в GUI - лише оформлення), тож
+позиції, що відрізняються перестановкою мастей, рівноцінні. Канонічний
+порядок: масті сортуються за станом столу, а при рівності - за картами
+масті в масках (рука, виключення за пропусками). Це той самий порядок,
+що й game_canonicalize у C++, тож ключі обох рушіїв збігаються.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+from typing import List, Sequence, Tuple
+
+from seven_game_types import is_standard_game
+
+SUIT_BITS = (1 << 9) - 1
+
+
+def suit_state(low: int, high: int) -> int:
+    """Стан масті на столі (0 - масті немає, 1-16), як Frontier::suitState"""
+    return 1 + (low - 6) * 8 + (high - 7) if low else 0
+
+
+def permute_mask(mask: int, perm: Sequence[int]) -> int:
+    """Маска карт у канонічних мастях (perm[канонічна масть] = початкова)"""
+    result = 0
+    for suit, original in enumerate(perm):
+        result |= ((mask >> (original * 9)) & SUIT_BITS) << (suit * 9)
+    return result
+
+
+def canonicalize(lo: Sequence[int], hi: Sequence[int],
+                 masks: Sequence[int]) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    Привести позицію до канонічного порядку мастей
+
+    Returns:
+        (lo, hi, masks, perm) - межі столу та маски в канонічних мастях і
+        perm[канонічна масть] = початкова масть
+    """
+    def key(suit):
+        return (suit_state(lo[suit], hi[suit]),) + tuple((m >> (suit * 9)) & SUIT_BITS for m in masks)
+
+    perm = sorted(range(4), key=key)
+    return ([lo[s] for s in perm], [hi[s] for s in perm],
+            [permute_mask(m, perm) for m in masks], perm)
+
+
+def table_bounds(state) -> Tuple[List[int], List[int]]:
+    """Межі столу по мастях з GameState (0 - масті немає)"""
+    lo, hi = [0] * 4, [0] * 4
+    for suit in range(4):
+        count = state.table_card_count[suit]
+        if count:
+            lo[suit] = state.table_state[suit][0].rank
+            hi[suit] = lo[suit] + count - 1
+    return lo, hi
+
+
+def canonical_position(engine, observer: int, canonicalize=canonicalize) -> Tuple[tuple, List[int]]:
+    """
+    Ключ позиції з точки зору observer, однаковий для всіх перестановок мастей
+
+    Ключ містить стіл, руку observer, виключення всіх гравців за
+    пропусками та кількість карт у руках.
+
+    Returns:
+        (ключ, perm), perm[канонічна масть] = початкова масть
+    """
+    if not is_standard_game(engine):
+        raise ValueError("Канонічний ключ - лише для стандартної гри з 2-4 гравцями")
+    state = engine.get_state()
+    lo, hi = table_bounds(state)
+    masks = [engine.get_hand_mask(observer)]
+    masks += [engine.get_pass_exclusions(p) for p in range(engine.num_players)]
+
+    lo, hi, masks, perm = canonicalize(lo, hi, masks)
+    counts = tuple(state.player_cards_count[p] for p in range(engine.num_players))
+    return (observer, state.current_player, counts, tuple(lo), tuple(hi), tuple(masks)), perm
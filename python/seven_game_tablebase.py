@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Таблиця ендшпілів гри "Сім" для 2 гравців
+
+Генерація ретроградним аналізом у C++ (game_tablebase_generate): для
+кожного стану столу та кожного розподілу карт поза столом, де цих карт
+не більше 2 * K, записується переможець і кількість ходів до кінця гри
+при оптимальній грі. Файл відображається в пам'ять (mmap), і C++ AI
+читає з нього найкращий хід за O(1).
+
+Використання:
+    python seven_game_tablebase.py generate --max-cards 5 --output endgame.svtb
+    python seven_game_tablebase.py info endgame.svtb
+    python seven_game_tablebase.py verify endgame.svtb --positions 1000
+
+Щоб таблиця завантажувалась автоматично, задайте SEVEN_GAME_TABLEBASE.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from seven_game_engine import (NativeSevenGameEngine as SevenGameEngine, Card, _LIB,
+                               load_tablebase, unload_tablebase)
+
+# Заголовок файлу (TablebaseHeader у seven_game_lib.cpp)
+HEADER_FORMAT = "<4sIII"
+MAGIC = b"SVTB"
+TABLE_CODES = 17 ** 4
+
+
+def generate(path: str, max_cards: int) -> bool:
+    """Обчислити таблицю для рук до max_cards карт і записати у path"""
+    if _LIB is None:
+        raise OSError("Генерація таблиці потребує C++ бібліотеки")
+    return bool(_LIB.game_tablebase_generate(os.fsencode(path), max_cards))
+
+
+def read_info(path: str) -> dict:
+    """Параметри файлу таблиці з його заголовка"""
+    with open(path, "rb") as f:
+        magic, version, max_cards, table_codes = struct.unpack(
+            HEADER_FORMAT, f.read(struct.calcsize(HEADER_FORMAT)))
+        f.seek(8 * table_codes, os.SEEK_CUR)
+        entries = struct.unpack("<Q", f.read(8))[0]
+
+    if magic != MAGIC:
+        raise ValueError(f"{path}: це не файл таблиці ендшпілів")
+
+    covered = entries // 2 if table_codes == TABLE_CODES else 0
+    return {"version": version, "max_cards": max_cards, "table_codes": table_codes,
+            "entries": entries, "positions": covered, "size": os.path.getsize(path)}
+
+
+def random_endgame(engine: SevenGameEngine, seed: int, max_rest: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Випадкова позиція, де на руках разом не більше max_rest карт
+
+    Returns:
+        Послідовність ходів від роздачі seed (None - гра закінчилась раніше)
+    """
+    rng = random.Random(seed)
+    engine.deal_cards_seeded(seed)
+    moves = []
+
+    while engine.check_winner() == -1:
+        if sum(len(engine.get_player_cards(p)) for p in range(2)) <= max_rest:
+            return moves
+        player = engine.get_current_player()
+        valid_moves = engine.get_valid_moves(player)
+        if not valid_moves:
+            engine.pass_turn()
+            moves.append(None)
+            continue
+        card = rng.choice(valid_moves)
+        engine.play_card(player, card)
+        moves.append((card.rank, card.suit))
+
+    return None
+
+
+def replay(engine: SevenGameEngine, seed: int, moves: List[Optional[Tuple[int, int]]]):
+    """Відтворити позицію з роздачі та ходів"""
+    engine.deal_cards_seeded(seed)
+    for move in moves:
+        if move is None:
+            engine.pass_turn()
+        else:
+            engine.play_card(engine.get_current_player(), Card(*move))
+
+
+def verify(path: str, positions: int, seed: int = 0) -> dict:
+    """
+    Порівняти таблицю з точним розв'язувачем (solve без таблиці)
+    на випадкових позиціях з розіграних роздач
+    """
+    engine = SevenGameEngine(2)
+    max_rest = 2 * read_info(path)["max_cards"]
+
+    unload_tablebase()
+    cases = []
+    game_seed = seed
+    while len(cases) < positions:
+        moves = random_endgame(engine, game_seed, max_rest)
+        if moves is not None:
+            cases.append((game_seed, moves, engine.solve()))
+        game_seed += 1
+
+    if not load_tablebase(path):
+        raise ValueError(f"Не вдалося завантажити {path}")
+
+    mismatches = []
+    start = time.perf_counter()
+    for case_seed, moves, expected in cases:
+        replay(engine, case_seed, moves)
+        probed = engine.tablebase_probe()
+        if probed != expected:
+            mismatches.append({"seed": case_seed, "expected": expected, "probed": probed})
+    elapsed = time.perf_counter() - start
+
+    return {"positions": len(cases), "mismatches": mismatches, "seconds": elapsed}
+
+
+def main():
+    """Запуск з командного рядка"""
+    parser = argparse.ArgumentParser(description="Таблиця ендшпілів гри 'Сім' для 2 гравців")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="обчислити таблицю")
+    gen.add_argument("--max-cards", type=int, default=5, help="K - карт на руці (1-7)")
+    gen.add_argument("--output", default="endgame.svtb")
+
+    info = commands.add_parser("info", help="параметри файлу таблиці")
+    info.add_argument("path")
+
+    check = commands.add_parser("verify", help="порівняти з точним розв'язувачем")
+    check.add_argument("path")
+    check.add_argument("--positions", type=int, default=1000)
+    check.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        start = time.perf_counter()
+        if not generate(args.output, args.max_cards):
+            print("Не вдалося обчислити таблицю", file=sys.stderr)
+            sys.exit(1)
+        result = read_info(args.output)
+        print(f"Таблиця K={result['max_cards']}: {result['positions']} позицій, "
+              f"{result['size'] / 2 ** 20:.1f} МБ за {time.perf_counter() - start:.1f} с")
+        print(f"Результат збережено: {args.output}")
+
+    elif args.command == "info":
+        result = read_info(args.path)
+        print(f"Версія: {result['version']}")
+        print(f"K (карт на руці): {result['max_cards']}")
+        print(f"Позицій: {result['positions']}")
+        print(f"Розмір: {result['size'] / 2 ** 20:.1f} МБ")
+
+    else:
+        result = verify(args.path, args.positions, args.seed)
+        print(f"Позицій: {result['positions']}, розбіжностей: {len(result['mismatches'])}")
+        for mismatch in result["mismatches"][:10]:
+            print(f"  {mismatch}")
+        if result["mismatches"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
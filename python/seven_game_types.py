@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Спільні структури C API гри "Сім" (ctypes)
+
+Використовуються і C++ рушієм через ctypes, і рушієм на чистому Python,
+тому винесені в окремий модуль.
+
+Розробник: Сергій Щербаков
+Email: sergiyscherbakov@ukr.net
+Telegram: @s_help_2010
+"""
+
+import ctypes
+from typing import List, Tuple
+
+
+class Card(ctypes.Structure):
+    """Структура карти"""
+    _fields_ = [
+        ("rank", ctypes.c_int),  # 6-14 (у стандартній колоді)
+        ("suit", ctypes.c_int),  # 0-3
+    ]
+
+    def __repr__(self):
+        rank_str = {
+            11: "J", 12: "Q", 13: "K", 14: "A"
+        }.get(self.rank, str(self.rank))
+
+        suit_symbols = ["♥", "♦", "♣", "♠"]
+        suit_str = suit_symbols[self.suit] if 0 <= self.suit < 4 else "?"
+
+        return f"{rank_str}{suit_str}"
+
+
+class GameState(ctypes.Structure):
+    """Структура стану гри"""
+    _fields_ = [
+        ("current_player", ctypes.c_int),
+        ("num_players", ctypes.c_int),
+        ("player_cards_count", ctypes.c_int * 4),
+        ("table_state", (Card * 9) * 4),
+        ("table_card_count", ctypes.c_int * 4),
+    ]
+
+
+class GameConfig(ctypes.Structure):
+    """Параметри гри для game_create_ex"""
+    _fields_ = [
+        ("num_players", ctypes.c_int),  # 2-8
+        ("min_rank", ctypes.c_int),     # 2-7
+        ("max_rank", ctypes.c_int),     # 7-14
+        ("num_decks", ctypes.c_int),    # 1-4
+    ]
+
+
+# Стандартна гра: одна колода з 36 карт (6-туз)
+STANDARD_RANKS = (6, 14)
+
+
+def is_standard_game(engine) -> bool:
+    """Стандартна гра (36 карт, 2-4 гравці): її описують GameState та маски по 9 біт на масть"""
+    return ((engine.min_rank, engine.max_rank, engine.num_decks) == STANDARD_RANKS + (1,)
+            and 2 <= engine.num_players <= 4)
+
+
+GAME_STATE_EX_VERSION = 1
+
+
+class GameStateEx(ctypes.Structure):
+    """
+    Стан гри будь-якого розміру (масиви виділяє викликач)
+
+    Ряд row на столі належить масті row // num_decks; row_low = 0 - ряд не почато.
+    """
+    _fields_ = [
+        ("version", ctypes.c_int),
+        ("current_player", ctypes.c_int),
+        ("num_players", ctypes.c_int),
+        ("num_rows", ctypes.c_int),
+        ("player_capacity", ctypes.c_int),
+        ("player_cards_count", ctypes.POINTER(ctypes.c_int)),
+        ("row_capacity", ctypes.c_int),
+        ("row_low", ctypes.POINTER(ctypes.c_int)),
+        ("row_high", ctypes.POINTER(ctypes.c_int)),
+    ]
+
+    @classmethod
+    def allocate(cls, num_players: int, num_rows: int) -> "GameStateEx":
+        """Стан з масивами на num_players гравців та num_rows рядів"""
+        state = cls(version=GAME_STATE_EX_VERSION,
+                    player_capacity=num_players, row_capacity=num_rows)
+        # ctypes тримає посилання на масиви, присвоєні полям-вказівникам
+        state.player_cards_count = (ctypes.c_int * num_players)()
+        state.row_low = (ctypes.c_int * num_rows)()
+        state.row_high = (ctypes.c_int * num_rows)()
+        return state
+
+    def card_counts(self) -> List[int]:
+        """Кількість карт кожного гравця"""
+        return self.player_cards_count[:self.num_players]
+
+    def rows(self) -> List[Tuple[int, int]]:
+        """Межі (low, high) кожного ряду столу"""
+        return list(zip(self.row_low[:self.num_rows], self.row_high[:self.num_rows]))
+
+
+# Типи подій гри (як у seven_game_lib.h)
+EVENT_CARD_PLAYED = 1
+EVENT_PASS = 2
+EVENT_TURN = 3
+EVENT_GAME_OVER = 4
+EVENT_DEAL = 5
+
+EVENT_NAMES = {
+    EVENT_CARD_PLAYED: "card_played",
+    EVENT_PASS: "pass",
+    EVENT_TURN: "turn",
+    EVENT_GAME_OVER: "game_over",
+    EVENT_DEAL: "deal",
+}
+
+# Скільки останніх подій зберігає гра
+EVENT_BUFFER_SIZE = 256
+
+
+class Event(ctypes.Structure):
+    """Подія гри"""
+    _fields_ = [
+        ("seq", ctypes.c_uint64),
+        ("type", ctypes.c_int),
+        ("player", ctypes.c_int),
+        ("card", Card),  # Лише для EVENT_CARD_PLAYED
+    ]
+
+    def __repr__(self):
+        name = EVENT_NAMES.get(self.type, "?")
+        if self.type == EVENT_CARD_PLAYED:
+            return f"Event({self.seq}, {name}, player={self.player}, card={self.card!r})"
+        return f"Event({self.seq}, {name}, player={self.player})"